@@ -4,6 +4,7 @@
 """
 
 import os
+import hashlib
 import json
 import shutil
 import threading
@@ -16,6 +17,8 @@ import tempfile
 
 from services.download_service import DownloadService
 from services.cache_service import CacheService
+from PySide6.QtCore import QObject, Signal, Slot
+
 from services.log_service import LogService
 
 
@@ -28,11 +31,17 @@ class BuildStatus(Enum):
     UNKNOWN = "unknown"       # Неизвестно
 
 
-class BuildManager:
+class BuildManager(QObject):
     """Менеджер для работы со сборками Minecraft"""
-    
+
+    # Смена состояния сборки: имя, статус, прогресс, сообщение.
+    # Сигнал доставляется в UI-поток очередью Qt, поэтому подписчики
+    # могут обновлять виджеты без опроса build_states
+    state_changed = Signal(str, object, int, str)
+
     def __init__(self, config_manager, minecraft_manager):
         """Инициализация менеджера сборок"""
+        super().__init__()
         self.config_manager = config_manager
         self.minecraft_manager = minecraft_manager
         self.minecraft_path = Path(self.config_manager.get("minecraft_path"))
@@ -56,6 +65,10 @@ class BuildManager:
         
         # Блокировка для потокобезопасности
         self._state_lock = threading.Lock()
+
+        # Пути библиотек, чей SHA1 уже сверен с манифестом в этой сессии:
+        # повторные create_build не хэшируют одни и те же файлы заново
+        self._lib_verified = set()
     
     def _create_directory_structure(self):
         """Создание структуры папок"""
@@ -273,7 +286,7 @@ class BuildManager:
         try:
             LogService.log('DEBUG', f"[BUILD] Получение информации о версии {version}")
             # Сначала пробуем получить из манифеста
-            manifest_url = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+            manifest_url = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
             LogService.log('DEBUG', f"[BUILD] Загрузка манифеста: {manifest_url}")
             with tempfile.NamedTemporaryFile(delete=False) as tmp_manifest:
                 if not DownloadService().download_file_sync(manifest_url, Path(tmp_manifest.name)):
@@ -368,6 +381,36 @@ class BuildManager:
         # Если правила не сработали - библиотека нужна
         return True
 
+    def _is_library_valid(self, lib_path: Path, sha1: Optional[str]) -> bool:
+        """
+        Проверяет, что библиотека уже скачана и совпадает по SHA1 из манифеста.
+        Проверка одного пути выполняется не чаще одного раза за сессию.
+        """
+        if lib_path in self._lib_verified:
+            return True
+        if not lib_path.exists():
+            return False
+        if not sha1:
+            # Хэш в манифесте не указан — достаточно существования файла
+            self._lib_verified.add(lib_path)
+            return True
+        try:
+            # Чтение блоками: hashlib.file_digest появился только в 3.11,
+            # а проект заявляет поддержку Python 3.8+
+            hasher = hashlib.sha1()
+            with open(lib_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+        except Exception as e:
+            LogService.log('WARNING', f"[BUILD] Не удалось посчитать SHA1 для {lib_path}: {e}")
+            return False
+        if digest == sha1:
+            self._lib_verified.add(lib_path)
+            return True
+        LogService.log('WARNING', f"[BUILD] SHA1 не совпадает, файл будет перекачан: {lib_path}")
+        return False
+
     def _download_libraries(self, libraries: List[Dict], progress_callback: Optional[Callable] = None, log_callback: Optional[Callable] = None) -> bool:
         try:
             LogService.log('DEBUG', f"[BUILD] Начало загрузки библиотек, всего: {len(libraries)}")
@@ -407,6 +450,11 @@ class BuildManager:
                     
                     if url and path:
                         lib_path = self.libraries_path / path
+                        # Скачанные и прошедшие SHA1-проверку файлы пропускаем:
+                        # частично скачанная библиотека хэш не пройдёт и будет перекачана
+                        if self._is_library_valid(lib_path, artifact.get("sha1")):
+                            LogService.log('DEBUG', f"[BUILD] Библиотека уже скачана: {path}")
+                            continue
                         files_to_download.append((url, lib_path))
                     else:
                         LogService.log('WARNING', f"[BUILD] Библиотека без URL или пути: {library}")
@@ -870,6 +918,7 @@ class BuildManager:
         except Exception as e:
             return False 
 
+    @Slot(str, object, int, str)
     def set_build_state(self, build_name: str, status: BuildStatus, progress: int = 0, message: str = ""):
         with self._state_lock:
             self.build_states[build_name] = {
@@ -877,6 +926,7 @@ class BuildManager:
                 "progress": progress,
                 "message": message
             }
+        self.state_changed.emit(build_name, status, progress, message)
 
     def get_build_state(self, build_name: str) -> dict:
         with self._state_lock:
@@ -102,6 +102,11 @@ class ConfigManager:
         self.config[key] = value
         self.save_config()
     
+    def get_geometry(self) -> tuple:
+        """Получение размеров окна одним обращением к конфигурации"""
+        config = self.config
+        return (config.get("window_width", 1200), config.get("window_height", 800))
+
     def get_profile(self, profile_name: str) -> Optional[Dict[str, Any]]:
         """Получение профиля по имени"""
         return self.profiles.get("profiles", {}).get(profile_name)
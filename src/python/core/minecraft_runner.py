@@ -83,15 +83,19 @@ class MinecraftRunner:
         if log_callback:
             log_callback(f"Запуск: {' '.join(cmd)}")
         try:
-            proc = subprocess.Popen(cmd, cwd=game_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            # stderr объединён с stdout: строки обоих потоков читаются по мере
+            # появления, а stderr не копится в буфере ОС до завершения stdout
+            # (при заполнении pipe это приводило к взаимной блокировке)
+            # На Windows не создаём консольное окно под процесс JVM
+            flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            # Пайп читается байтами: декодирование готовой строки с 'replace'
+            # дешевле инкрементального декодера text=True и не падает
+            # на битых байтах в логах модов
+            proc = subprocess.Popen(cmd, cwd=game_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, creationflags=flags)
             if proc.stdout is not None:
                 for line in proc.stdout:
                     if log_callback:
-                        log_callback(line.rstrip())
-            if proc.stderr is not None:
-                for line in proc.stderr:
-                    if log_callback:
-                        log_callback(line.rstrip())
+                        log_callback(line.decode('utf-8', 'replace').rstrip())
             proc.wait()
             if log_callback:
                 if proc.returncode == 0:
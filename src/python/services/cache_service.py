@@ -12,6 +12,12 @@ class CacheService:
     _instance = None
     _timer = None
 
+    # Записи условных HTTP-запросов (ETag-кэш DownloadService) живут по
+    # собственному длинному TTL на чтении; общая чистка их не трогает,
+    # иначе офлайн-фолбэк и хранилище ETag пропадали бы каждые 2 часа.
+    # Двоеточие в ключах заменяется на '_' в _key_to_path
+    _PERSISTENT_PREFIXES = ('http_', 'httpmeta_')
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -83,6 +89,8 @@ class CacheService:
         max_age = max_age_seconds or self.default_ttl
         now = time.time()
         for file in self.cache_dir.glob('*'):
+            if file.name.startswith(self._PERSISTENT_PREFIXES):
+                continue
             try:
                 age = now - file.stat().st_mtime
                 if age > max_age:
@@ -90,6 +98,14 @@ class CacheService:
             except Exception as e:
                 LogService.log('ERROR', f'Ошибка очистки кэша: {e}', source='CacheService')
 
+    def touch(self, key: str):
+        """Продлить жизнь записи: обновить mtime файла без перезаписи"""
+        path = self._key_to_path(key)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
     def cleanup_on_timer(self, interval_seconds: Optional[int] = None):
         interval = interval_seconds or 2*60*60  # 2 часа по умолчанию
         if self._timer:
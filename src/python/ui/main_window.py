@@ -3,7 +3,9 @@
 Основной интерфейс приложения
 """
 
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QPushButton, QLabel, QMessageBox, QSizePolicy, QFrame, QStackedWidget, QGridLayout, QDialog
+import string
+
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox, QFrame, QStackedWidget, QGridLayout, QDialog, QButtonGroup, QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
 from ui.tabs.profiles_tab import ProfilesTab, get_avatar_pixmap
@@ -23,6 +25,35 @@ MC_BORDER = "#333"
 MC_BLUE = "#3a7dcf"
 MC_GREEN = "#3a7d44"
 
+# Стили кнопок боковой панели: подстановка цветов выполняется один раз при импорте
+_SIDEBAR_TPL = string.Template('''
+    QPushButton[sidebar="true"] {
+        border-radius: 8px;
+        padding: 14px 18px;
+        font-size: 16px;
+        color: $muted;
+        background: $gray;
+        border: 2px solid $border;
+        margin-bottom: 8px;
+        text-align: left;
+        font-weight: 500;
+    }
+    QPushButton[sidebar="true"]:checked {
+        background: $blue;
+        color: $light;
+        border: 2px solid $blue;
+        font-weight: bold;
+    }
+    QPushButton[sidebar="true"]:hover {
+        background: $green;
+        color: $light;
+    }
+''')
+SIDEBAR_QSS = _SIDEBAR_TPL.substitute(
+    muted=MC_TEXT_MUTED, gray=MC_GRAY, border=MC_BORDER,
+    blue=MC_BLUE, green=MC_GREEN, light=MC_TEXT_LIGHT
+)
+
 
 class ProfileWidget(QFrame):
     def __init__(self, config_manager, on_click=None, parent=None):
@@ -37,11 +68,19 @@ class ProfileWidget(QFrame):
         self.avatar = QLabel()
         self.avatar.setPixmap(pixmap)
         layout.addWidget(self.avatar)
-        self.nick = QLabel(active or "Гость")
+        # Кэшируем ник строкой — горячие пути не гоняют QString туда-обратно
+        self._nick_text = active or "Гость"
+        self.nick = QLabel(self._nick_text)
         self.nick.setStyleSheet("color: white; font-weight: bold; font-size: 16px;")
         layout.addWidget(self.nick)
         layout.addStretch()
         self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def set_nick(self, nick):
+        """Обновление ника: и кэш-строка, и QLabel"""
+        self._nick_text = nick or "Гость"
+        self.nick.setText(self._nick_text)
+
     def mousePressEvent(self, event):
         if self.on_click:
             self.on_click()
@@ -98,19 +137,22 @@ class HomePage(QWidget):
             tabs_layout.addWidget(btn)
         tabs_layout.addStretch()
         layout.addLayout(tabs_layout)
-        # Сетка карточек (заглушки)
+        # Сетка карточек (заглушки): одно общее правило стиля вместо шести одинаковых
+        self.setStyleSheet("QFrame#cardFrame { border: 1px solid #aaa; border-radius: 8px; min-width: 160px; min-height: 120px; }")
+        self.setUpdatesEnabled(False)
         grid = QGridLayout()
         for i in range(2):
             for j in range(3):
                 card = QFrame()
-                card.setStyleSheet("border: 1px solid #aaa; border-radius: 8px; min-width: 160px; min-height: 120px;")
+                card.setObjectName("cardFrame")
                 vbox = QVBoxLayout(card)
-                vbox.addWidget(QLabel(f"1.21.{i*3+j+1}"))
-                vbox.addWidget(QLabel("Описание"))
+                # Заглушка: один QLabel с rich-text вместо двух отдельных QLabel
+                vbox.addWidget(QLabel(f"<b>1.21.{i*3+j+1}</b><br>Описание"))
                 play_btn = QPushButton("Играть")
                 vbox.addWidget(play_btn)
                 grid.addWidget(card, i, j)
         layout.addLayout(grid)
+        self.setUpdatesEnabled(True)
 
 
 class MainWindow(QMainWindow):
@@ -122,14 +164,16 @@ class MainWindow(QMainWindow):
         
         self.config_manager = config_manager
         self.theme_manager = theme_manager
-        
+
+        # Кэш словаря профилей на время одного UI-события
+        self._profile_cache = None
+
         # Настройка окна
         self.setWindowTitle("TMKL - The Minecraft Launcher")
         self.setMinimumSize(1000, 700)
         
         # Восстанавливаем размер окна
-        width = self.config_manager.get("window_width", 1200)
-        height = self.config_manager.get("window_height", 800)
+        width, height = self.config_manager.get_geometry()
         self.resize(width, height)
         
         # Создание интерфейса
@@ -141,6 +185,8 @@ class MainWindow(QMainWindow):
         central_widget = QWidget()
         central_widget.setStyleSheet("background: #23272e; border-radius: 24px; border: none;")
         self.setCentralWidget(central_widget)
+        # Одна компоновка/перерисовка в конце вместо каскада на каждый addWidget
+        central_widget.setUpdatesEnabled(False)
         main_layout = QHBoxLayout(central_widget)
         # Боковое меню
         sidebar = QVBoxLayout()
@@ -156,54 +202,32 @@ class MainWindow(QMainWindow):
         self.profile_widget = ProfileWidget(self.config_manager, on_click=self.goto_profiles)
         sidebar.addWidget(self.profile_widget)
         sidebar.addSpacing(16)
-        # Стили для кнопок боковой панели
-        sidebar_btn_style = f'''
-            QPushButton[sidebar="true"] {{
-                border-radius: 8px;
-                padding: 14px 18px;
-                font-size: 16px;
-                color: {MC_TEXT_MUTED};
-                background: {MC_GRAY};
-                border: 2px solid {MC_BORDER};
-                margin-bottom: 8px;
-                text-align: left;
-                font-weight: 500;
-            }}
-            QPushButton[sidebar="true"]:checked {{
-                background: {MC_BLUE};
-                color: {MC_TEXT_LIGHT};
-                border: 2px solid {MC_BLUE};
-                font-weight: bold;
-            }}
-            QPushButton[sidebar="true"]:hover {{
-                background: {MC_GREEN};
-                color: {MC_TEXT_LIGHT};
-            }}
-        '''
-        self.setStyleSheet(self.styleSheet() + sidebar_btn_style)
-        # Кнопки боковой панели
-        self.home_btn = QPushButton("Главная")
-        self.home_btn.setCheckable(True)
-        self.home_btn.setProperty("sidebar", True)
-        sidebar.addWidget(self.home_btn)
-        self.install_btn = QPushButton("Установки")
-        self.install_btn.setCheckable(True)
-        self.install_btn.setProperty("sidebar", True)
-        sidebar.addWidget(self.install_btn)
-        sidebar.addStretch()
-        self.news_btn = QPushButton("Что нового")
-        self.news_btn.setCheckable(True)
-        self.news_btn.setProperty("sidebar", True)
-        self.settings_btn = QPushButton("Настройки")
-        self.settings_btn.setCheckable(True)
-        self.settings_btn.setProperty("sidebar", True)
-        sidebar.addWidget(self.news_btn)
-        sidebar.addWidget(self.settings_btn)
-        # Группа для эксклюзивного выбора
-        self.sidebar_btns = [self.home_btn, self.install_btn, self.news_btn, self.settings_btn]
-        def set_active_sidebar(idx):
-            for i, btn in enumerate(self.sidebar_btns):
-                btn.setChecked(i == idx)
+        # Стили для кнопок боковой панели (готовая строка с уровня модуля)
+        self.setStyleSheet(self.styleSheet() + SIDEBAR_QSS)
+        # Кнопки боковой панели: создаём по спецификации, None — растяжка
+        specs = [
+            ("Главная", "home_btn"),
+            ("Установки", "install_btn"),
+            (None, None),
+            ("Что нового", "news_btn"),
+            ("Настройки", "settings_btn"),
+        ]
+        sidebar_btns = []
+        for label, attr in specs:
+            if label is None:
+                sidebar.addStretch()
+                continue
+            btn = QPushButton(label)
+            btn.setCheckable(True)
+            btn.setProperty("sidebar", True)
+            sidebar.addWidget(btn)
+            setattr(self, attr, btn)
+            sidebar_btns.append(btn)
+        # Группа для эксклюзивного выбора (переключение состояний делает Qt)
+        self.sidebar_group = QButtonGroup(self)
+        self.sidebar_group.setExclusive(True)
+        for i, btn in enumerate(sidebar_btns):
+            self.sidebar_group.addButton(btn, i)
         # Основная часть
         content_layout = QVBoxLayout()
         header_layout = QHBoxLayout()
@@ -218,37 +242,54 @@ class MainWindow(QMainWindow):
         self.page_home = QWidget()  # Пустая главная
         # Создание InstallationsTab с передачей функции получения ника
         def get_active_nick():
-            return self.profile_widget.nick.text() if self.profile_widget.nick.text() != "Гость" else "Player"
+            nick = self.profile_widget._nick_text
+            return nick if nick != "Гость" else "Player"
         minecraft_manager = MinecraftManager(self.config_manager)
         build_manager = BuildManager(self.config_manager, minecraft_manager)
         self.installations_tab = InstallationsTab(build_manager, minecraft_manager, get_nick_func=get_active_nick)
         self.settings_tab = SettingsTab(self.config_manager, build_manager)
-        self.stack.addWidget(self.page_home)
-        self.stack.addWidget(self.installations_tab)
-        self.stack.addWidget(self.settings_tab)
+        # Индексы страниц стека — setCurrentIndex не сканирует стек в отличие от setCurrentWidget
+        self.IDX_HOME = self.stack.addWidget(self.page_home)
+        self.IDX_INSTALL = self.stack.addWidget(self.installations_tab)
+        self.IDX_SETTINGS = self.stack.addWidget(self.settings_tab)
         content_layout.addWidget(self.stack)
         main_layout.addWidget(sidebar_widget)
         main_layout.addLayout(content_layout)
-        # Сигналы для переключения страниц и выделения активной кнопки
-        self.home_btn.clicked.connect(lambda: [self.stack.setCurrentWidget(self.page_home), set_active_sidebar(0)])
-        self.install_btn.clicked.connect(lambda: [self.stack.setCurrentWidget(self.installations_tab), set_active_sidebar(1)])
-        self.news_btn.clicked.connect(lambda: set_active_sidebar(2))
-        self.settings_btn.clicked.connect(lambda: [self.stack.setCurrentWidget(self.settings_tab), set_active_sidebar(3)])
-        set_active_sidebar(0)
+        # Сигналы для переключения страниц: одна кнопка — один индекс стека
+        self._sidebar_page_indices = [self.IDX_HOME, self.IDX_INSTALL, None, self.IDX_SETTINGS]
+        self.sidebar_group.idClicked.connect(self._on_sidebar_clicked)
+        self.home_btn.setChecked(True)
+        central_widget.setUpdatesEnabled(True)
+
+    def _on_sidebar_clicked(self, idx):
+        """Переключение страницы по индексу кнопки боковой панели"""
+        page_idx = self._sidebar_page_indices[idx]
+        if page_idx is not None:
+            self.stack.setCurrentIndex(page_idx)
+
+    def _profiles(self):
+        """Словарь профилей с кэшированием — обработчики кликов не читают конфиг дважды"""
+        if self._profile_cache is None:
+            self._profile_cache = self.config_manager.profiles.get("profiles", {})
+        return self._profile_cache
+
+    def invalidate_profile_cache(self):
+        """Сброс кэша профилей (вызывать при смене/добавлении профиля)"""
+        self._profile_cache = None
 
     def update_play_button(self):
         """Включает или выключает кнопку 'ИГРАТЬ' в зависимости от наличия профиля"""
-        profiles = self.config_manager.profiles.get("profiles", {})
+        profiles = self._profiles()
         active = self.config_manager.get_active_profile()
         enabled = bool(profiles) and active in profiles
         # self.play_button.setEnabled(enabled)
 
     def on_play_clicked(self):
-        profiles = self.config_manager.profiles.get("profiles", {})
+        profiles = self._profiles()
         active = self.config_manager.get_active_profile()
         if not profiles or not active or active not in profiles:
             # Переключаемся на вкладку профилей
-            self.stack.setCurrentWidget(self.page_home)
+            self.stack.setCurrentIndex(self.IDX_HOME)
             QMessageBox.information(self, "Нет профиля", "Создайте профиль для начала игры.")
             return
         
@@ -258,9 +299,18 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "Запуск", f"Запуск игры за {active}")
 
     def toggle_theme(self):
-        from PySide6.QtWidgets import QApplication
         app = QApplication.instance()
         self.theme_manager.toggle_theme(app)
 
     def goto_profiles(self):
-        self.stack.setCurrentWidget(self.page_home)
+        self.invalidate_profile_cache()
+        self.stack.setCurrentIndex(self.IDX_HOME)
+
+    def closeEvent(self, event):
+        """Закрытие окна: останавливаем фоновые потоки вкладки установок
+
+        Qt доставляет close только top-level окну, поэтому вложенная вкладка
+        сама этого события не получит — передаём его явно.
+        """
+        self.installations_tab.shutdown_workers()
+        super().closeEvent(event)
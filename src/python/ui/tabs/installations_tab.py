@@ -1,16 +1,19 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox, 
     QListWidget, QListWidgetItem, QSizePolicy, QDialog, QDialogButtonBox, 
-    QMessageBox, QMenu, QTabWidget, QCheckBox, QScrollArea, QFrame, QGridLayout, 
-    QGraphicsDropShadowEffect, QProgressBar, QButtonGroup, QStackedWidget, QFileDialog, QTextEdit
+    QMessageBox, QMenu, QTabWidget, QCheckBox, QScrollArea, QFrame, QGridLayout,
+    QProgressBar, QButtonGroup, QStackedWidget, QFileDialog, QPlainTextEdit
 )
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QTimer, QObject, QRectF, Slot, QThread
-from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QFont, QPixmap
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRectF, Slot, QThread, QThreadPool, QRunnable, QPropertyAnimation, QEasingCurve, QStringListModel, QFileSystemWatcher
+from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QFont, QPixmap, QPixmapCache
 import os
+import functools
+import itertools
 import json
-import urllib.request
+import re
+import time
 import threading
-from core.build_manager import BuildManager
+from core.build_manager import BuildManager, BuildStatus
 from pathlib import Path
 import shutil
 import subprocess
@@ -22,6 +25,10 @@ from services.download_service import DownloadService
 from services.log_service import LogService
 from core.minecraft_runner import MinecraftRunner
 
+# Политика перерисовки: для запроса перерисовки использовать только update(),
+# никогда repaint() — update() позволяет Qt объединить несколько «грязных»
+# областей в один paintEvent и не провоцирует рекурсивную отрисовку.
+
 # Цвета из CSS
 MC_DARK_GREEN = "#2d6135"
 MC_GREEN = "#3a7d44"
@@ -46,11 +53,267 @@ MC_PIXEL = "rgba(0, 0, 0, 0.15)"
 VERSION_TYPES = ["release", "snapshot", "beta", "alpha"]
 TYPE_LABELS = {"release": "Release", "snapshot": "Snapshot", "beta": "Beta", "alpha": "Alpha"}
 
-MOJANG_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+MOJANG_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+
+# Плейсхолдеры вида ${auth_player_name} в аргументах запуска
+_MC_VAR = re.compile(r'\$\{([^}]+)\}')
+
+# Диспетчеризация по лоадерам вместо цепочки elif
+LOADER_FETCHERS = {
+    "Fabric": "get_fabric_loader_versions",
+    "Forge": "get_forge_loader_versions",
+    "Quilt": "get_quilt_loader_versions",
+    "NeoForge": "get_neoforge_loader_versions",
+    "Paper": "get_paper_versions",
+    "Purpur": "get_purpur_versions",
+}
+LOADER_TOOLTIPS = {
+    "Paper": "Paper — только для серверов. Нельзя запускать моды, только плагины!",
+    "Purpur": "Purpur — только для серверов. Нельзя запускать моды, только плагины!",
+}
+
+# Основной стиль вкладки установок: собирается один раз при импорте модуля
+_TAB_STYLESHEET = f"""
+    QWidget {{
+        background: {MC_DARK};
+        color: {MC_TEXT};
+        font-family: 'Rubik', Arial, sans-serif;
+    }}
+    QPushButton.sidebar-tab {{
+        border-radius: 8px;
+        padding: 14px 18px;
+        font-size: 16px;
+        color: {MC_TEXT_MUTED};
+        background: {MC_GRAY};
+        border: 2px solid {MC_BORDER};
+        margin-bottom: 8px;
+        text-align: left;
+        font-weight: 500;
+    }}
+    QPushButton.sidebar-tab:checked {{
+        background: {MC_BLUE};
+        color: {MC_TEXT_LIGHT};
+        border: 2px solid {MC_BLUE};
+        font-weight: bold;
+    }}
+    QPushButton.sidebar-tab:hover {{
+        background: {MC_GREEN};
+        color: {MC_TEXT_LIGHT};
+    }}
+"""
+
+# Стили карточек сборок и общих комбобоксов: формируются один раз при
+# импорте, CSS-парсер Qt не гоняется заново на каждую карточку
+_CARD_STYLE = f"""
+    QFrame {{
+        background: {MC_GRAY};
+        border: 2px solid {MC_BORDER};
+        border-radius: 12px;
+        margin: 0px;
+        padding: 10px 18px;
+    }}
+"""
+_CARD_NO_IMG_STYLE = f"color: {MC_TEXT_MUTED}; font-size: 12px;"
+_CARD_ERR_STYLE = "color: #e74c3c; font-size: 13px; font-weight: bold;"
+_CARD_NAME_STYLE = f"font-size: 18px; color: {MC_TEXT_LIGHT};"
+_PLAY_BTN_STYLE = (
+    "QPushButton#playBtn {"
+    "padding: 8px 18px;"
+    "border-radius: 8px;"
+    "background: #3a7d44;"
+    "color: white;"
+    "font-weight: bold;"
+    "border: none;"
+    "}"
+)
+_SETTINGS_BTN_STYLE = (
+    "QPushButton#settingsBtn {"
+    "padding: 8px 18px;"
+    "border-radius: 8px;"
+    "background: #3a7dcf;"
+    "color: white;"
+    "font-weight: bold;"
+    "border: none;"
+    "}"
+)
+_COMBO_STYLE = f"""
+    QComboBox {{
+        background: {MC_GRAY};
+        border: 2px solid {MC_BORDER};
+        border-radius: 8px;
+        color: {MC_TEXT_LIGHT};
+        font-size: 16px;
+        padding: 10px;
+    }}
+    QComboBox::drop-down {{
+        border: none;
+        background: transparent;
+    }}
+    QComboBox QAbstractItemView {{
+        background: {MC_GRAY};
+        color: {MC_TEXT_LIGHT};
+        border: 2px solid {MC_BORDER};
+        selection-background-color: rgba(58, 125, 207, 0.3);
+        selection-color: {MC_TEXT_LIGHT};
+        outline: 0;
+    }}
+"""
+
+_IMG_PREVIEW_STYLE = f"""
+    background: {MC_GRAY};
+    border: 2.5px solid {MC_BORDER};
+    border-radius: 8px;
+    font-size: 16px;
+    color: {MC_TEXT_MUTED};
+    qproperty-alignment: AlignCenter;
+"""
+
+_NAME_EDIT_STYLE = f"""
+    font-size: 16px;
+    padding: 10px;
+    border-radius: 8px;
+    border: 2px solid {MC_BORDER};
+    background: {MC_GRAY};
+    color: {MC_TEXT_LIGHT};
+"""
+
+_LOG_TEXT_STYLE = f"""
+    background: {MC_GRAY};
+    border: 2px solid {MC_BORDER};
+    border-radius: 8px;
+    color: {MC_TEXT_LIGHT};
+    font-size: 14px;
+    padding: 8px;
+"""
+
+_CREATE_BTN_STYLE = f"""
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {MC_BLUE}, stop:1 {MC_PURPLE});
+    color: white;
+    border-radius: 8px;
+    font-weight: bold;
+    font-size: 18px;
+    padding: 12px 24px;
+    border: none;
+"""
+
+_PROGRESS_STYLE = f"""
+    height: 8px;
+    border-radius: 4px;
+    background: {MC_GRAY};
+    border: 1px solid {MC_BORDER};
+"""
+
+# Общие QFont на стиль текста: размер шрифта задаётся напрямую, а не через
+# CSS-движок; стилевые строки меток остаются только для цвета
+FONT_TITLE = QFont("Rubik", 12, QFont.Weight.Bold)
+FONT_SUB = QFont("Rubik", 10)
+FONT_MUTED = QFont("Rubik", 9)
+
+# Отмасштабированные превью сборок живут в общем кэше Qt (32 МиБ),
+# чтобы не декодировать картинку заново при каждом построении карточки
+QPixmapCache.setCacheLimit(32 * 1024)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_version_json(path: str, mtime_ns: int) -> dict:
+    """
+    JSON версии кэшируется по (путь, mtime): обновление вкладки и запуск
+    не парсят один и тот же файл заново, правка файла сбрасывает кэш.
+    """
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _scan_libs(libs_dir: str) -> frozenset:
+    """
+    Один рекурсивный обход папки libraries вместо stat() на каждый артефакт.
+    Результат не кэшируется между вызовами: mtime корня меняется только при
+    добавлении прямого потомка, а библиотеки ложатся в глубокие maven-пути,
+    так что ключ по mtime не замечал свежие установки.
+    """
+    found = set()
+    for root, _dirs, files in os.walk(libs_dir):
+        rel_root = os.path.relpath(root, libs_dir)
+        for fname in files:
+            rel = fname if rel_root == '.' else os.path.join(rel_root, fname)
+            found.add(rel.replace(os.sep, '/'))
+    return frozenset(found)
+
+
+def _find_java_in_registry():
+    """Ищет java через реестр Windows (ключи JavaSoft с JavaHome)"""
+    try:
+        import winreg
+    except ImportError:
+        return None
+    key_names = (
+        r"SOFTWARE\JavaSoft\JDK",
+        r"SOFTWARE\JavaSoft\Java Development Kit",
+        r"SOFTWARE\JavaSoft\Java Runtime Environment",
+    )
+    for key_name in key_names:
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_name) as key:
+                for i in range(winreg.QueryInfoKey(key)[0]):
+                    try:
+                        with winreg.OpenKey(key, winreg.EnumKey(key, i)) as sub_key:
+                            java_home, _ = winreg.QueryValueEx(sub_key, "JavaHome")
+                    except OSError:
+                        continue
+                    for exe in ("javaw.exe", "java.exe"):
+                        candidate = os.path.join(java_home, "bin", exe)
+                        if os.path.isfile(candidate):
+                            return candidate
+        except OSError:
+            continue
+    return None
 
 class VersionCard(QFrame):
     installed_signal = Signal(dict)
-    
+
+    # Стиль карточки: f-строка вычисляется один раз при определении класса,
+    # каждый экземпляр получает одну и ту же строку по ссылке
+    _STYLESHEET = f"""
+        QFrame#VersionCard {{
+            background: {MC_GRAY};
+            border: 2px solid {MC_BORDER};
+            border-radius: 12px;
+            margin: 6px;
+        }}
+        QFrame#VersionCard:hover {{
+            border: 2px solid {MC_GREEN};
+            background: rgba(58, 125, 68, 0.1);
+            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
+        }}
+        QLabel {{
+            color: {MC_TEXT};
+        }}
+        QPushButton {{
+            background: {MC_GREEN};
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 8px 16px;
+            font-weight: 500;
+        }}
+        QPushButton:hover {{
+            background: {MC_DARK_GREEN};
+        }}
+        QPushButton:disabled {{
+            background: #444;
+            color: #aaa;
+        }}
+        QProgressBar {{
+            height: 6px;
+            border-radius: 3px;
+            background: rgba(0, 0, 0, 0.3);
+        }}
+        QProgressBar::chunk {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {MC_GREEN}, stop:1 {MC_LIGHT_GREEN});
+            border-radius: 3px;
+        }}
+    """
+
     def __init__(self, version, installed=False, parent=None):
         super().__init__(parent)
         try:
@@ -62,63 +325,15 @@ class VersionCard(QFrame):
             self.setObjectName("VersionCard")
             self.setFrameShape(QFrame.Shape.StyledPanel)
             
-            # Стиль карточки версии
-            self.setStyleSheet(f"""
-                QFrame#VersionCard {{
-                    background: {MC_GRAY};
-                    border: 2px solid {MC_BORDER};
-                    border-radius: 12px;
-                    margin: 6px;
-                }}
-                QFrame#VersionCard:hover {{
-                    border: 2px solid {MC_GREEN};
-                    background: rgba(58, 125, 68, 0.1);
-                    box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-                }}
-                QLabel {{
-                    color: {MC_TEXT};
-                }}
-                QPushButton {{
-                    background: {MC_GREEN};
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background: {MC_DARK_GREEN};
-                }}
-                QPushButton:disabled {{
-                    background: #444;
-                    color: #aaa;
-                }}
-                QProgressBar {{
-                    height: 6px;
-                    border-radius: 3px;
-                    background: rgba(0, 0, 0, 0.3);
-                }}
-                QProgressBar::chunk {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {MC_GREEN}, stop:1 {MC_LIGHT_GREEN});
-                    border-radius: 3px;
-                }}
-            """)
-            
-            # Drop shadow
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(16)
-            shadow.setOffset(0, 4)
-            shadow.setColor(QColor(0, 0, 0, 100))
-            self.setGraphicsEffect(shadow)
-            
-            # Анимация увеличения
-            self.anim = QPropertyAnimation(self, b"geometry")
-            self.anim.setDuration(120)
-            self.anim.setEasingCurve(QEasingCurve.Type.OutQuad)
-            self._orig_geom = None
-            self.enterEvent = self._on_enter
-            self.leaveEvent = self._on_leave
+            # Стиль карточки версии (общая строка уровня класса)
+            self.setStyleSheet(VersionCard._STYLESHEET)
             
+            # Тень через QGraphicsDropShadowEffect убрана: эффект заставлял Qt
+            # растеризовать карточку в offscreen-буфер и размывать его на каждую
+            # перерисовку; визуальное выделение даёт рамка из :hover-правила.
+            # Анимация geometry при наведении убрана по той же причине —
+            # она инвалидировала layout и перерисовывала соседние карточки.
+
             layout = QHBoxLayout(self)
             layout.setContentsMargins(12, 12, 12, 12)
             layout.setSpacing(15)
@@ -128,13 +343,16 @@ class VersionCard(QFrame):
             info.setSpacing(4)
             
             name = QLabel(f"<b>{version['name']}</b>")
-            name.setStyleSheet(f"font-size: 16px; color: {MC_TEXT_LIGHT};")
-            
+            name.setFont(FONT_TITLE)
+            name.setStyleSheet(f"color: {MC_TEXT_LIGHT};")
+
             vtype = QLabel(TYPE_LABELS.get(version["type"], version["type"]))
-            vtype.setStyleSheet(f"font-size: 14px; color: {MC_TEXT_MUTED};")
-            
+            vtype.setFont(FONT_SUB)
+            vtype.setStyleSheet(f"color: {MC_TEXT_MUTED};")
+
             date = QLabel(version.get("date", ""))
-            date.setStyleSheet(f"font-size: 12px; color: {MC_TEXT_MUTED};")
+            date.setFont(FONT_MUTED)
+            date.setStyleSheet(f"color: {MC_TEXT_MUTED};")
             
             info.addWidget(name)
             info.addWidget(vtype)
@@ -151,7 +369,8 @@ class VersionCard(QFrame):
             
             # Статус
             self.status_label = QLabel("Установлено" if installed else "Не установлено")
-            self.status_label.setStyleSheet(f"font-size: 14px; color: {MC_GREEN if installed else MC_TEXT_MUTED};")
+            self.status_label.setFont(FONT_SUB)
+            self.status_label.setStyleSheet(f"color: {MC_GREEN if installed else MC_TEXT_MUTED};")
             layout.addWidget(self.status_label)
             
             # Прогресс-бар
@@ -162,9 +381,7 @@ class VersionCard(QFrame):
             self.progress.setVisible(False)
             self.progress.setFixedWidth(100)
             layout.addWidget(self.progress)
-            
-            self.timer = None
-            
+
         except Exception as e:
             LogService.log('ERROR', f"[UI] Ошибка создания VersionCard: {e}", source="InstallationsTab")
             # Создаем минимальный виджет с ошибкой
@@ -174,28 +391,6 @@ class VersionCard(QFrame):
             error_label.setStyleSheet(f"color: {MC_RED};")
             layout.addWidget(error_label)
 
-    def _on_enter(self, event):
-        try:
-            if not self._orig_geom:
-                self._orig_geom = self.geometry()
-            rect = self.geometry().adjusted(-6, -6, 6, 6)
-            self.anim.stop()
-            self.anim.setStartValue(self.geometry())
-            self.anim.setEndValue(rect)
-            self.anim.start()
-        except Exception as e:
-            LogService.log('ERROR', f"[UI] Ошибка в _on_enter: {e}", source="InstallationsTab")
-
-    def _on_leave(self, event):
-        try:
-            if self._orig_geom:
-                self.anim.stop()
-                self.anim.setStartValue(self.geometry())
-                self.anim.setEndValue(self._orig_geom)
-                self.anim.start()
-        except Exception as e:
-            LogService.log('ERROR', f"[UI] Ошибка в _on_leave: {e}", source="InstallationsTab")
-
     def start_install(self):
         try:
             self.install_btn.setEnabled(False)
@@ -203,38 +398,78 @@ class VersionCard(QFrame):
             self.progress.setValue(0)
             self.status_label.setText("Установка...")
             self.status_label.setStyleSheet(f"color: {MC_BLUE};")
-            
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self._on_progress)
-            self.timer.start(30)
-            
+
+            # Демонстрационная установка: прогресс ведёт QPropertyAnimation —
+            # Qt сам планирует кадры вместо таймера с тиками по 30 мс;
+            # реальный установщик подключается к слоту set_progress напрямую
+            self._demo_anim = QPropertyAnimation(self.progress, b"value", self)
+            self._demo_anim.setDuration(1500)
+            self._demo_anim.setStartValue(0)
+            self._demo_anim.setEndValue(100)
+            self._demo_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+            self._demo_anim.finished.connect(lambda: self.set_progress(100))
+            self._demo_anim.start()
+
         except Exception as e:
             LogService.log('ERROR', f"[UI] Ошибка при запуске установки: {e}", source="InstallationsTab")
 
-    def _on_progress(self):
+    @Slot(int, str)
+    def set_progress(self, value, text=""):
+        """Обновить прогресс карточки извне (значение 0-100 и текст статуса)"""
         try:
-            val = self.progress.value() + 2
-            if val >= 100:
+            if value >= 100:
+                if getattr(self, '_demo_anim', None) is not None:
+                    self._demo_anim.stop()
+                    self._demo_anim = None
                 self.progress.setValue(100)
                 self.progress.setVisible(False)
                 self.status_label.setText("Установлено")
                 self.status_label.setStyleSheet(f"color: {MC_GREEN};")
                 self.install_btn.setText("Установлено")
                 self.install_btn.setEnabled(False)
-                if self.timer:
-                    self.timer.stop()
                 self.installed_signal.emit(self.version)
-            else:
-                self.progress.setValue(val)
+                return
+            if self.isVisible():
+                # Скрытые карточки (за пределами scroll area) не гоняют перерисовку
+                self.progress.setValue(value)
+            if text:
+                self.status_label.setText(text)
         except Exception as e:
-            LogService.log('ERROR', f"[UI] Ошибка в _on_progress: {e}", source="InstallationsTab")
+            LogService.log('ERROR', f"[UI] Ошибка в set_progress: {e}", source="InstallationsTab")
+
+# Таблицы статусов карточки сборки: текст и цвет по ключу статуса,
+# вместо цепочек if в методах
+_STATUS_TEXT = {
+    "ready": "Готово к запуску",
+    "downloading": "Загрузка...",
+    "installing": "Установка...",
+    "error": "Ошибка",
+}
+_STATUS_COLOR = {
+    "ready": "#4caf50",
+    "downloading": "#ffaa00",
+    "installing": "#3a7dcf",
+    "error": "#dc3545",
+}
 
 class InstalledVersionWidget(QWidget):
     remove_requested = Signal(dict)
     launch_requested = Signal(dict)
-    
+
+    _STYLESHEET = """
+        QWidget {
+            background: #23272e;
+            border-radius: 14px;
+            border: 2px solid #333;
+        }
+    """
+
+
     def __init__(self, version, parent=None):
         super().__init__(parent)
+        if not version or not isinstance(version, dict):
+            LogService.log('ERROR', f"[UI] Некорректная версия для InstalledVersionWidget: {version}", source="InstallationsTab")
+            version = {"name": "Unknown", "status": "unknown"}
         self.version = version
         self.build_name = version.get('name', '')
         self.status = version.get('status', 'unknown')
@@ -246,27 +481,24 @@ class InstalledVersionWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
-        self.setStyleSheet("""
-            QWidget {
-                background: #23272e;
-                border-radius: 14px;
-                border: 2px solid #333;
-            }
-        """)
+        self.setStyleSheet(InstalledVersionWidget._STYLESHEET)
         # Название и иконка
         title_layout = QHBoxLayout()
         title = QLabel(f"<b>{self.build_name}</b>")
-        title.setStyleSheet("font-size: 16px; color: #fff;")
+        title.setFont(FONT_TITLE)
+        title.setStyleSheet("color: #fff;")
         title_layout.addWidget(title)
         title_layout.addStretch()
         layout.addLayout(title_layout)
         # Версия и лоадер
         sub = QLabel(f"{self.version.get('minecraft_version', '')} - {self.version.get('loader', '')}")
-        sub.setStyleSheet("color: #aaa; font-size: 13px;")
+        sub.setFont(FONT_SUB)
+        sub.setStyleSheet("color: #aaa;")
         layout.addWidget(sub)
         # Статус
         self.status_label = QLabel(self._get_status_text(self.status))
-        self.status_label.setStyleSheet(f"color: {self._get_status_color(self.status)}; font-size: 13px;")
+        self.status_label.setFont(FONT_SUB)
+        self.status_label.setStyleSheet(f"color: {self._get_status_color(self.status)};")
         layout.addWidget(self.status_label)
         # Кнопки
         btns = QHBoxLayout()
@@ -280,24 +512,22 @@ class InstalledVersionWidget(QWidget):
         btns.addWidget(del_btn)
         layout.addLayout(btns)
     def _get_status_text(self, status):
-        if status == "ready": return "Готово к запуску"
-        if status == "downloading": return "Загрузка..."
-        if status == "installing": return "Установка..."
-        if status == "error": return "Ошибка"
-        return "Неизвестно"
+        return _STATUS_TEXT.get(status, "Неизвестно")
     def _get_status_color(self, status):
-        if status == "ready": return "#4caf50"
-        if status == "downloading": return "#ffaa00"
-        if status == "installing": return "#3a7dcf"
-        if status == "error": return "#dc3545"
-        return "#aaa"
+        return _STATUS_COLOR.get(status, "#aaa")
     def update_status(self, status, progress=0, message=""):
+        # Повторный вызов с теми же значениями не трогает виджеты:
+        # setText/setStyleSheet даже с прежним содержимым ведут к перерисовке
+        if status == self.status and progress == self.progress and message == self.message:
+            return
+        status_changed = status != self.status
         self.status = status
         self.progress = progress
         self.message = message
-        self.status_label.setText(self._get_status_text(status))
-        self.status_label.setStyleSheet(f"color: {self._get_status_color(status)}; font-size: 13px;")
-        self.launch_btn.setEnabled(status == "ready")
+        if status_changed:
+            self.status_label.setText(self._get_status_text(status))
+            self.status_label.setStyleSheet(f"color: {self._get_status_color(status)};")
+            self.launch_btn.setEnabled(status == "ready")
     def _on_launch(self):
         self.launch_requested.emit(self.version)
     def _on_delete(self):
@@ -306,6 +536,22 @@ class InstalledVersionWidget(QWidget):
 class LoaderUpdater(QObject):
     update = Signal(list)
 
+class LoaderFetchRunnable(QRunnable):
+    """Фоновая загрузка списка версий лоадера через общий пул потоков"""
+    def __init__(self, fetcher, mc_version, callback):
+        super().__init__()
+        self.fetcher = fetcher
+        self.mc_version = mc_version
+        self.callback = callback
+
+    def run(self):
+        try:
+            versions = self.fetcher(self.mc_version)
+        except Exception as e:
+            LogService.log('ERROR', f"[UI] Ошибка загрузки версий лоадера: {e}", source="InstallationsTab")
+            versions = []
+        self.callback(versions)
+
 class RoundedPanel(QWidget):
     def __init__(self, parent=None, radius=18, bg_color=MC_GRAY, border_color=MC_BORDER, border_width=2):
         super().__init__(parent)
@@ -313,28 +559,48 @@ class RoundedPanel(QWidget):
         self.bg_color = QColor(bg_color)
         self.border_color = QColor(border_color)
         self.border_width = border_width
+        # Кисть и перо не зависят от размера — создаются один раз,
+        # а не на каждую перерисовку
+        bg = QColor(self.bg_color)
+        bg.setAlpha(200)
+        self._brush = QBrush(bg)
+        self._pen = QPen(self.border_color, self.border_width)
+        # Растеризованный фон панели: перерисовывается только при смене размера
+        self._bg_pixmap = None
+        self._bg_size = None
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAutoFillBackground(False)
-        
-        # Добавляем эффект размытия фона
-        self.setGraphicsEffect(QGraphicsDropShadowEffect(
-            blurRadius=15, 
-            xOffset=0, 
-            yOffset=4, 
-            color=QColor(0, 0, 0, 100)
-        ))
+
+    def resizeEvent(self, event):
+        # Размер изменился — закэшированный фон больше не подходит
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+
+    def _render_background(self):
+        """Отрисовка скруглённого фона в pixmap под текущий размер"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(0, 0, self.width(), self.height())
+        rect.adjust(self.border_width/2, self.border_width/2, -self.border_width/2, -self.border_width/2)
+        painter.setBrush(self._brush)
+        painter.setPen(self._pen)
+        painter.drawRoundedRect(rect, self.radius, self.radius)
+        painter.end()
+        self._bg_pixmap = pixmap
+        self._bg_size = self.size()
 
     def paintEvent(self, event):
         try:
+            # Фон с прозрачностью берётся из кэша по размеру: сглаженный
+            # скруглённый прямоугольник растеризуется один раз, дальше — блит
+            if self._bg_pixmap is None or self._bg_size != self.size():
+                self._render_background()
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            rect = QRectF(self.rect())
-            rect.adjust(self.border_width/2, self.border_width/2, -self.border_width/2, -self.border_width/2)
-            
-            # Рисуем фон с прозрачностью
-            painter.setBrush(QBrush(QColor(self.bg_color.red(), self.bg_color.green(), self.bg_color.blue(), 200)))
-            painter.setPen(QPen(self.border_color, self.border_width))
-            painter.drawRoundedRect(rect, self.radius, self.radius)
+            painter.drawPixmap(0, 0, self._bg_pixmap)
         except Exception as e:
             LogService.log('ERROR', f"[UI] Ошибка отрисовки RoundedPanel: {e}", source="InstallationsTab")
 
@@ -349,10 +615,11 @@ class BuildWorker(QObject):
         self.build_manager = build_manager
         self.build_config = build_config
         self.is_running = False
+        self._last_emit = 0.0  # Для троттлинга progress-сигналов
+        self._last_value = -1  # Последнее отправленное значение прогресса
         LogService.log('INFO', f"[WORKER] BuildWorker создан для сборки: {build_config.get('name', 'Unknown')}", source="InstallationsTab")
 
     def run(self):
-        print('BuildWorker.run called')
         self.is_running = True
         
         def progress_callback(*args):
@@ -370,12 +637,28 @@ class BuildWorker(QObject):
                 message = None
             else:
                 return
-            print(f"PROGRESS: {current}/{total if total is not None else '-'} - {message}")
+            # Троттлинг до ~30 Гц и по величине шага: значения, отличающиеся
+            # от последнего отправленного меньше чем на 5%, на полосе прогресса
+            # всё равно неразличимы, а каждый emit проходит через очередь
+            # событий Qt. Прогресс сборки не монотонный — каждая фаза
+            # (клиент, библиотеки, assets, лоадер) шлёт свои 0-100, поэтому
+            # откат значения означает новую фазу и сбрасывает отсчёт,
+            # а отрицательные (ошибка) и финальные значения проходят всегда.
+            now = time.monotonic()
+            if current < 0 or current >= 100:
+                self._last_value = -1
+            elif current < self._last_value:
+                # Новая фаза: пропускаем первое значение с её текстом статуса
+                self._last_value = current
+            elif now - self._last_emit < 0.033 or current - self._last_value < 5:
+                return
+            else:
+                self._last_value = current
+            self._last_emit = now
             self.progress.emit(current, message)
-            
+
         def log_callback(msg):
             if self.is_running:
-                print(f"LOG: {msg}")
                 self.log_msg.emit(msg)
             
         try:
@@ -385,7 +668,6 @@ class BuildWorker(QObject):
             else:
                 self.error.emit("Ошибка создания сборки")
         except Exception as e:
-            print(f"EXCEPTION in BuildWorker.run: {e}")
             self.log_msg.emit(f"Критическая ошибка: {e}")
             self.error.emit(str(e))
         finally:
@@ -395,8 +677,49 @@ class BuildWorker(QObject):
         """Остановка процесса создания сборки"""
         self.is_running = False
 
+class LazyVersionCombo(QComboBox):
+    """
+    Комбобокс с отложенным заполнением: при построении добавляются только
+    последние релизы, а полный список (~700 версий) догружается при первом
+    открытии выпадающего списка.
+    """
+
+    INITIAL_ITEMS = 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending_items = []
+
+    def set_full_items(self, items):
+        """Показывает первые INITIAL_ITEMS, остальные — при первом showPopup
+
+        Принимает любой итерируемый объект: первые элементы снимаются с
+        итератора сразу, хвост остаётся в _pending_items. Возвращает True,
+        если список непустой.
+        """
+        it = iter(items)
+        head = list(itertools.islice(it, self.INITIAL_ITEMS))
+        self._pending_items = list(it)
+        self.blockSignals(True)
+        self.clear()
+        self.addItems(head)
+        self.blockSignals(False)
+        return bool(head)
+
+    def showPopup(self):
+        if self._pending_items:
+            self.blockSignals(True)
+            self.addItems(self._pending_items)
+            self._pending_items = []
+            self.blockSignals(False)
+        super().showPopup()
+
+
 class InstallationsTab(QWidget):
     progress_update = Signal(int, str)
+    versions_ready = Signal(list)
+
+    _LOADER_CACHE_TTL = 60  # секунд: срок жизни записи кэша версий лоадера
     request_update_builds = Signal()
     request_add_build = Signal(dict)
     request_handle_error = Signal(str, str)
@@ -410,64 +733,81 @@ class InstallationsTab(QWidget):
         self.threads = []  # Для хранения активных QThread
         self.build_widgets = {}  # Словарь для хранения виджетов сборок
         self.current_build_name = None  # Имя выбранной сборки
+        self._last_builds_refresh = 0.0  # Для троттлинга перестроения списка
+        self._loader_versions_cache = {}  # (loader, mc_version) -> (время, список версий)
+        self._loader_request_seq = 0  # Номер последнего запроса версий лоадера
+        self._release_ids = None  # Релизные id из фоновой загрузки манифеста
+        self._build_status = {}  # build -> (mtime json, errors, missing_libs)
+        self._cp_cache = {}  # build -> (mtime json, собранный classpath)
+        self._args_cache = {}  # build -> (mtime json, jvm-шаблоны, game-шаблоны)
         self.setup_ui()
         self.update_my_builds()
-        
-        # Таймер для автообновления
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.auto_update_builds)
-        self.update_timer.start(2000)  # Обновление каждые 2 секунды
-        
+
+        # Отдельный пул на сетевые запросы вкладки: не больше четырёх
+        # одновременных загрузок, чтобы не занимать весь глобальный пул
+        self._fetch_pool = QThreadPool(self)
+        self._fetch_pool.setMaxThreadCount(4)
+
+        # Манифест версий грузится в фоне, а не синхронно при построении вкладки
+        self.versions_ready.connect(self._on_versions_ready)
+        self._fetch_pool.start(
+            LoaderFetchRunnable(lambda _: list(self.minecraft_manager.get_release_version_ids()), None, self.versions_ready.emit)
+        )
+
+        # Список сборок обновляется по сигналам воркеров (finished/error),
+        # а не по таймеру: опрос каждые 2 секунды перестраивал сетку впустую.
+        # Изменения извне (папка сборки добавлена/удалена не через лаунчер)
+        # ловит наблюдатель файловой системы — событие вместо опроса
+        self._builds_watcher = QFileSystemWatcher(self)
+        self._builds_watcher.addPath(str(self.build_manager.config_manager.get_versions_path()))
+        self._builds_watcher.directoryChanged.connect(lambda _path: self.request_update_builds.emit())
+
+        # Статусы карточек обновляются push-ом из BuildManager
+        self.build_manager.state_changed.connect(self._on_build_state)
+
         # Сигналы для потокобезопасного обновления UI
         self.request_update_builds.connect(self.update_my_builds)
         self.request_add_build.connect(self.add_build_to_list)
         self.request_handle_error.connect(self.handle_build_error)
         self.request_remove_build.connect(self.remove_build)
         
-        # Основной стиль вкладки
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: {MC_DARK};
-                color: {MC_TEXT};
-                font-family: 'Rubik', Arial, sans-serif;
-            }}
-            QPushButton.sidebar-tab {{
-                border-radius: 8px;
-                padding: 14px 18px;
-                font-size: 16px;
-                color: {MC_TEXT_MUTED};
-                background: {MC_GRAY};
-                border: 2px solid {MC_BORDER};
-                margin-bottom: 8px;
-                text-align: left;
-                font-weight: 500;
-            }}
-            QPushButton.sidebar-tab:checked {{
-                background: {MC_BLUE};
-                color: {MC_TEXT_LIGHT};
-                border: 2px solid {MC_BLUE};
-                font-weight: bold;
-            }}
-            QPushButton.sidebar-tab:hover {{
-                background: {MC_GREEN};
-                color: {MC_TEXT_LIGHT};
-            }}
-        """)
+        # Основной стиль вкладки (готовая строка с уровня модуля)
+        self.setStyleSheet(_TAB_STYLESHEET)
+
+        # Буфер логов: строки копятся в списке и выводятся в виджет пачкой
+        # раз в 50 мс — один appendPlainText вместо пересборки документа
+        # на каждую строку; заодно вывод всегда происходит в UI-потоке
+        self._log_buf = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start()
+
         LogService.subscribe(self._ui_log_subscriber)
 
     def _ui_log_subscriber(self, log_entry):
-        # Фильтруем логи по source (build_name)
+        # Фильтруем логи по source (build_name) и складываем в буфер;
+        # в виджет строки попадают пачкой из _flush_log
         if self.current_build_name and log_entry.get('source') == self.current_build_name:
-            self.log_text.append(log_entry['message'])
+            self._log_buf.append(log_entry['message'])
+
+    def _flush_log(self):
+        """Пакетный вывод накопленных строк лога в виджет (раз в 50 мс)"""
+        if not self._log_buf or not self._create_tab_built:
+            return
+        buf, self._log_buf = self._log_buf, []
+        self.log_text.appendPlainText("\n".join(buf))
 
     def select_build(self, build_name):
         # Вызывается при выборе сборки пользователем
         self.current_build_name = build_name
+        if not self._create_tab_built:
+            return
         self.log_text.clear()
         # Можно подгрузить последние логи из LogService.get_recent() и отфильтровать по source
         for log in LogService.get_recent(200):
             if log.get('source') == build_name:
-                self.log_text.append(log['message'])
+                self.log_text.appendPlainText(log['message'])
 
     def handle_build_error(self, build_name, error_message):
         """Stub for handling build errors. Implement logic if needed. Arguments are likely build name/id and error message."""
@@ -514,28 +854,32 @@ class InstallationsTab(QWidget):
         self.tabs_content = QStackedWidget()
         main_layout.addWidget(self.tabs_content)
         
-        # Вкладка 'Мои сборки' с прокруткой и сеткой
+        # Вкладка 'Мои сборки' с прокруткой; контейнер создаётся один раз,
+        # update_my_builds только добавляет/убирает карточки
         self.my_builds_tab = QWidget()
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.grid_container = QWidget()
-        self.grid_layout = QGridLayout(self.grid_container)
-        self.grid_layout.setSpacing(18)
-        self.grid_layout.setContentsMargins(18, 18, 18, 18)
-        self.scroll_area.setWidget(self.grid_container)
+        self.scroll_area.setStyleSheet("background: transparent; border: none;")
+        self.builds_container = QWidget()
+        self.builds_vbox = QVBoxLayout(self.builds_container)
+        self.builds_vbox.setContentsMargins(12, 12, 12, 12)
+        self.builds_vbox.setSpacing(16)
+        self.empty_label = QLabel("У вас пока нет сборок", alignment=Qt.AlignmentFlag.AlignCenter)
+        self.builds_vbox.addWidget(self.empty_label)
+        self.builds_vbox.addStretch()
+        self.scroll_area.setWidget(self.builds_container)
         vbox = QVBoxLayout(self.my_builds_tab)
         vbox.addWidget(self.scroll_area)
         self.tabs_content.addWidget(self.my_builds_tab)
         
-        # Вкладка 'Создать сборку'
+        # Вкладки 'Создать сборку' и 'Готовые сборки' строятся лениво,
+        # при первом открытии — пока пустые заглушки, чтобы индексы стека совпадали
         self.create_tab = QWidget()
-        self.setup_create_tab()
+        self._create_tab_built = False
         self.tabs_content.addWidget(self.create_tab)
-        
-        # Вкладка 'Готовые сборки'
+
         self.ready_tab = RoundedPanel()
-        ready_layout = QVBoxLayout(self.ready_tab)
-        ready_layout.addWidget(QLabel("Готовые сборки (скоро)", alignment=Qt.AlignmentFlag.AlignCenter))
+        self._ready_tab_built = False
         self.tabs_content.addWidget(self.ready_tab)
         
         # Логика переключения вкладок
@@ -544,80 +888,71 @@ class InstallationsTab(QWidget):
         self.btn_ready.clicked.connect(lambda: self.set_active_tab(2))
         self.set_active_tab(0)
         
+    def _wire_create_tab(self):
+        """Подключение сигналов формы создания сборки (после setup_create_tab)"""
         # Обработка смены лоадера
         loader_updater = LoaderUpdater()
         
         def update_loader_versions(versions):
-            self.loader_ver_combo.clear()
-            if versions:
-                self.loader_ver_combo.addItems(versions)
-            else:
-                self.loader_ver_combo.addItem('Версии не найдены')
-            update_build_name()
+            # Подмена модели целиком: один reset вместо N вставок, сигналы
+            # выбора на время подмены глушатся, чтобы не дёргать обработчики.
+            # update_build_name не нужен — название не зависит от версии лоадера
+            self.loader_ver_combo.blockSignals(True)
+            model = QStringListModel(versions or ['Версии не найдены'], self.loader_ver_combo)
+            self.loader_ver_combo.setModel(model)
+            self.loader_ver_combo.setCurrentIndex(0)
+            self.loader_ver_combo.blockSignals(False)
         
         loader_updater.update.connect(update_loader_versions)
-        
+
+        def submit_fetch(loader, fetcher, mc_version):
+            # Каждый запрос получает порядковый номер: ответ устаревшего
+            # запроса (пользователь уже переключился) молча отбрасывается
+            self._loader_request_seq += 1
+            token = self._loader_request_seq
+            # Сначала кэш: повторный выбор того же лоадера в пределах минуты
+            # не ходит в сеть, а устаревшая запись перезапрашивается
+            key = (loader, mc_version)
+            cached = self._loader_versions_cache.get(key)
+            if cached is not None and time.time() - cached[0] < self._LOADER_CACHE_TTL:
+                loader_updater.update.emit(cached[1])
+                return
+
+            def on_done(versions, key=key, token=token):
+                self._loader_versions_cache[key] = (time.time(), versions)
+                if token == self._loader_request_seq:
+                    loader_updater.update.emit(versions)
+
+            self._fetch_pool.start(LoaderFetchRunnable(fetcher, mc_version, on_done))
+
+        def _do_fetch_current():
+            loader = self.loader_combo.currentText()
+            method = LOADER_FETCHERS.get(loader)
+            mc_version = self.version_combo.currentText()
+            if method and mc_version:
+                submit_fetch(loader, getattr(self.minecraft_manager, method), mc_version)
+
+        # Дебаунс сетевых запросов: при быстрой прокрутке комбобоксов
+        # в сеть уходит только последний выбор, а не каждый промежуточный
+        self._fetch_debounce = QTimer(self)
+        self._fetch_debounce.setSingleShot(True)
+        self._fetch_debounce.setInterval(250)
+        self._fetch_debounce.timeout.connect(_do_fetch_current)
+
         def on_loader_changed(text):
             if text == "Vanilla":
                 self.loader_ver_combo.clear()
                 self.loader_ver_combo.setVisible(False)
                 update_build_name()
-            elif text == "Fabric":
-                self.loader_ver_combo.clear()
-                self.loader_ver_combo.setVisible(True)
-                mc_version = self.version_combo.currentText()
-                def fetch_fabric_versions():
-                    versions = self.minecraft_manager.get_fabric_loader_versions(mc_version)
-                    loader_updater.update.emit(versions)
-                    update_build_name()
-                threading.Thread(target=fetch_fabric_versions).start() if mc_version else None
-            elif text == "Forge":
-                self.loader_ver_combo.clear()
-                self.loader_ver_combo.setVisible(True)
-                mc_version = self.version_combo.currentText()
-                def fetch_forge_versions():
-                    versions = self.minecraft_manager.get_forge_loader_versions(mc_version)
-                    loader_updater.update.emit(versions)
-                    update_build_name()
-                threading.Thread(target=fetch_forge_versions).start() if mc_version else None
-            elif text == "Quilt":
-                self.loader_ver_combo.clear()
-                self.loader_ver_combo.setVisible(True)
-                mc_version = self.version_combo.currentText()
-                def fetch_quilt_versions():
-                    versions = self.minecraft_manager.get_quilt_loader_versions(mc_version)
-                    loader_updater.update.emit(versions)
-                    update_build_name()
-                threading.Thread(target=fetch_quilt_versions).start() if mc_version else None
-            elif text == "NeoForge":
-                self.loader_ver_combo.clear()
-                self.loader_ver_combo.setVisible(True)
-                mc_version = self.version_combo.currentText()
-                def fetch_neoforge_versions():
-                    versions = self.minecraft_manager.get_neoforge_loader_versions(mc_version)
-                    loader_updater.update.emit(versions)
-                    update_build_name()
-                threading.Thread(target=fetch_neoforge_versions).start() if mc_version else None
-            elif text == "Paper":
-                self.loader_ver_combo.clear()
-                self.loader_ver_combo.setVisible(True)
-                mc_version = self.version_combo.currentText()
-                def fetch_paper_versions():
-                    versions = self.minecraft_manager.get_paper_versions(mc_version)
-                    loader_updater.update.emit(versions)
-                    update_build_name()
-                threading.Thread(target=fetch_paper_versions).start() if mc_version else None
-                self.loader_combo.setToolTip("Paper — только для серверов. Нельзя запускать моды, только плагины!")
-            elif text == "Purpur":
+                return
+            method = LOADER_FETCHERS.get(text)
+            if method:
                 self.loader_ver_combo.clear()
                 self.loader_ver_combo.setVisible(True)
-                mc_version = self.version_combo.currentText()
-                def fetch_purpur_versions():
-                    versions = self.minecraft_manager.get_purpur_versions(mc_version)
-                    loader_updater.update.emit(versions)
-                    update_build_name()
-                threading.Thread(target=fetch_purpur_versions).start() if mc_version else None
-                self.loader_combo.setToolTip("Purpur — только для серверов. Нельзя запускать моды, только плагины!")
+                if self.version_combo.currentText():
+                    self._fetch_debounce.start()
+                self.loader_combo.setToolTip(LOADER_TOOLTIPS.get(text, ""))
+                update_build_name()
             else:
                 self.loader_ver_combo.clear()
                 self.loader_ver_combo.addItems(["0.14.21", "0.14.20", "0.14.19"])
@@ -634,20 +969,18 @@ class InstallationsTab(QWidget):
         # Всплывающая подсказка при наведении на Paper/Purpur
         def show_loader_tooltip(index):
             text = self.loader_combo.itemText(index)
-            if text == "Paper":
-                self.loader_combo.setToolTip("Paper — только для серверов. Нельзя запускать моды, только плагины!")
-            elif text == "Purpur":
-                self.loader_combo.setToolTip("Purpur — только для серверов. Нельзя запускать моды, только плагины!")
-            else:
-                self.loader_combo.setToolTip("")
+            self.loader_combo.setToolTip(LOADER_TOOLTIPS.get(text, ""))
         
         self.loader_combo.highlighted.connect(show_loader_tooltip)
         
         # Автоматическое формирование названия сборки
         def update_build_name():
+            # Пока комбобокс показывает заглушку "Загрузка...", название не трогаем
+            if not self.version_combo.isEnabled():
+                return
             mc_version = self.version_combo.currentText()
             loader = self.loader_combo.currentText()
-            
+
             if not mc_version:
                 return
             
@@ -655,12 +988,15 @@ class InstallationsTab(QWidget):
                 build_name = f"Minecraft {mc_version}"
             else:
                 build_name = f"Minecraft {mc_version} with {loader}"
-            
-            self.name_edit.setText(build_name)
-        
-        # Подключаем обновление названия к изменениям в комбобоксах
-        self.version_combo.currentTextChanged.connect(lambda _: update_build_name())
-        self.loader_combo.currentTextChanged.connect(lambda _: update_build_name())
+
+            # Не трогаем QLineEdit без необходимости — setText с тем же текстом
+            # всё равно прогнал бы цепочку textChanged
+            if self.name_edit.text() != build_name:
+                self.name_edit.setText(build_name)
+
+        # Название обновляется одним путём: смена версии/лоадера идёт через
+        # on_loader_changed, который вызывает update_build_name сам; отдельное
+        # подключение остаётся только для версии лоадера
         self.loader_ver_combo.currentTextChanged.connect(lambda _: update_build_name())
         
         # Скрыть loader_ver_combo при инициализации, если выбран Vanilla
@@ -683,18 +1019,11 @@ class InstallationsTab(QWidget):
         img_layout = QVBoxLayout()
         self.image_preview = QLabel()
         self.image_preview.setFixedSize(120, 120)
-        self.image_preview.setStyleSheet(f"""
-            background: {MC_GRAY};
-            border: 2.5px solid {MC_BORDER};
-            border-radius: 8px;
-            font-size: 16px;
-            color: {MC_TEXT_MUTED};
-            qproperty-alignment: AlignCenter;
-        """)
+        self.image_preview.setStyleSheet(_IMG_PREVIEW_STYLE)
         self.image_preview.setText("Нет картинки")
         img_layout.addWidget(self.image_preview)
         self.select_img_btn = QPushButton("Выбрать картинку")
-        self.select_img_btn.setStyleSheet(f"padding: 6px 16px; margin-top: 8px;")
+        self.select_img_btn.setStyleSheet("padding: 6px 16px; margin-top: 8px;")
         img_layout.addWidget(self.select_img_btn)
         self.selected_image_path = None
         def choose_image():
@@ -716,53 +1045,25 @@ class InstallationsTab(QWidget):
         # Поле названия сборки
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Название сборки")
-        self.name_edit.setStyleSheet(f"""
-            font-size: 16px;
-            padding: 10px;
-            border-radius: 8px;
-            border: 2px solid {MC_BORDER};
-            background: {MC_GRAY};
-            color: {MC_TEXT_LIGHT};
-        """)
+        self.name_edit.setStyleSheet(_NAME_EDIT_STYLE)
         fields_layout.addWidget(self.name_edit)
         
-        # Комбобокс версии Minecraft
-        self.version_combo = QComboBox()
-        all_versions = self.minecraft_manager.get_available_versions()
-        release_versions = [v["id"] for v in all_versions if v["type"] == "release"]
-        self.version_combo.addItems(release_versions)
-        self.version_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {MC_GRAY};
-                border: 2px solid {MC_BORDER};
-                border-radius: 8px;
-                color: {MC_TEXT_LIGHT};
-                font-size: 16px;
-                padding: 10px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                background: transparent;
-            }}
-            QComboBox QAbstractItemView {{
-                background: {MC_GRAY};
-                color: {MC_TEXT_LIGHT};
-                border: 2px solid {MC_BORDER};
-                selection-background-color: rgba(58, 125, 207, 0.3);
-                selection-color: {MC_TEXT_LIGHT};
-                outline: 0;
-            }}
-        """)
+        # Комбобокс версии Minecraft: заполняется из versions_ready, когда
+        # фоновая загрузка манифеста завершится
+        self.version_combo = LazyVersionCombo()
+        self.version_combo.addItem("Загрузка...")
+        self.version_combo.setEnabled(False)
+        self.version_combo.setStyleSheet(_COMBO_STYLE)
         
         # Комбобокс лоадера
         self.loader_combo = QComboBox()
         self.loader_combo.addItems(["Vanilla", "Fabric", "Forge", "NeoForge", "Quilt"])
-        self.loader_combo.setStyleSheet(self.version_combo.styleSheet())
+        self.loader_combo.setStyleSheet(_COMBO_STYLE)
         
         # Комбобокс версии лоадера
         self.loader_ver_combo = QComboBox()
         self.loader_ver_combo.addItems(["0.14.21", "0.14.20", "0.14.19"])
-        self.loader_ver_combo.setStyleSheet(self.version_combo.styleSheet())
+        self.loader_ver_combo.setStyleSheet(_COMBO_STYLE)
         
         fields_layout.addWidget(self.version_combo)
         fields_layout.addWidget(self.loader_combo)
@@ -770,77 +1071,90 @@ class InstallationsTab(QWidget):
         top_layout.addLayout(fields_layout)
         form_outer.addLayout(top_layout)
         
-        # Логи процесса
-        self.log_text = QTextEdit()
+        # Логи процесса: QPlainTextEdit с ограничением блоков — движок
+        # rich-text в QTextEdit перестраивал документ на каждую строку
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(1000)
         self.log_text.setFixedHeight(120)
-        self.log_text.setStyleSheet(f"""
-            background: {MC_GRAY};
-            border: 2px solid {MC_BORDER};
-            border-radius: 8px;
-            color: {MC_TEXT_LIGHT};
-            font-size: 14px;
-            padding: 8px;
-        """)
+        self.log_text.setStyleSheet(_LOG_TEXT_STYLE)
         form_outer.addWidget(self.log_text)
         form_outer.addStretch()
         
         # Кнопка создания и прогресс-бар
         create_btn = QPushButton("Создать сборку")
-        create_btn.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {MC_BLUE}, stop:1 {MC_PURPLE});
-            color: white;
-            border-radius: 8px;
-            font-weight: bold;
-            font-size: 18px;
-            padding: 12px 24px;
-            border: none;
-        """)
+        create_btn.setStyleSheet(_CREATE_BTN_STYLE)
         create_btn.setMinimumHeight(48)
         create_btn.clicked.connect(self.create_build)
         form_outer.addWidget(create_btn)
         
         self.progress = QProgressBar()
         self.progress.setValue(0)
-        self.progress.setStyleSheet(f"""
-            height: 8px;
-            border-radius: 4px;
-            background: {MC_GRAY};
-            border: 1px solid {MC_BORDER};
-        """)
+        self.progress.setStyleSheet(_PROGRESS_STYLE)
         self.progress.setTextVisible(False)
         self.progress.setVisible(False)
         form_outer.addWidget(self.progress)
 
+    @Slot(list)
+    def _on_versions_ready(self, release_ids):
+        """Приём результата фоновой загрузки манифеста версий
+
+        Фильтрация по типу уже сделана в фоне генератором
+        MinecraftManager.get_release_version_ids.
+        """
+        self._release_ids = release_ids or []
+        if self._create_tab_built:
+            self._populate_version_combo()
+        self._prefetch_loader_manifests()
+
+    def _prefetch_loader_manifests(self):
+        """Прогрев манифестов лоадеров в фоне для свежей версии Minecraft
+
+        Ответы оседают в дисковом ETag-кэше DownloadService, поэтому первый
+        реальный выбор лоадера обходится условным запросом вместо полной
+        загрузки.
+        """
+        # Манифест отсортирован от новых к старым — первый id и есть свежий релиз
+        latest = self._release_ids[0] if self._release_ids else None
+        if not latest:
+            return
+        for loader, method in LOADER_FETCHERS.items():
+            def on_done(versions, key=(loader, latest)):
+                self._loader_versions_cache[key] = (time.time(), versions)
+            self._fetch_pool.start(
+                LoaderFetchRunnable(getattr(self.minecraft_manager, method), latest, on_done)
+            )
+
+    def _populate_version_combo(self):
+        """Заполнение комбобокса версий из загруженного манифеста"""
+        # Сразу видны только последние релизы, хвост списка комбобокс
+        # дозаполнит при первом открытии
+        if self.version_combo.set_full_items(self._release_ids):
+            self.version_combo.setEnabled(True)
+            # Один осмысленный сигнал после массового заполнения
+            self.version_combo.currentTextChanged.emit(self.version_combo.currentText())
+        else:
+            self.version_combo.blockSignals(True)
+            self.version_combo.clear()
+            self.version_combo.addItem("Версии не найдены")
+            self.version_combo.blockSignals(False)
+
     @Slot(int, str)
     def _on_progress_update(self, value, text):
+        # Горячий путь: слот вызывается на каждый тик прогресса. Сигнал
+        # доставляется через событийный цикл в UI-поток, поэтому проверка
+        # потока и DEBUG-логирование каждого тика здесь не нужны.
+        if not self._create_tab_built:
+            return
         try:
-            assert threading.current_thread() == threading.main_thread(), "_on_progress_update: UI update not in main thread!"
-            
-            LogService.log('DEBUG', f"[UI] Обновление прогресса: {value}% - {text}", source="InstallationsTab")
-            
-            # Проверяем, что прогресс-бар доступен
-            if not hasattr(self, 'progress') or not self.progress:
-                LogService.log('WARNING', "[UI] Прогресс-бар недоступен", source="InstallationsTab")
-                return
-                
-            # Обновляем прогресс-бар
-            try:
-                if value >= 0:
-                    self.progress.setValue(value)
-                    self.progress.setVisible(True)
-                else:
-                    # Отрицательное значение означает ошибку
-                    self.progress.setVisible(False)
-                    
-                # Обновляем текст статуса если есть
-                # status_label может не существовать в этом классе
-                        
-            except Exception as e:
-                LogService.log('ERROR', f"[UI] Ошибка обновления прогресс-бара: {e}", source="InstallationsTab")
-                
+            if value >= 0:
+                self.progress.setValue(value)
+                self.progress.setVisible(True)
+            else:
+                # Отрицательное значение означает ошибку
+                self.progress.setVisible(False)
         except Exception as e:
-            LogService.log('CRITICAL', f"[UI] Критическая ошибка в _on_progress_update: {e}", source="InstallationsTab")
+            LogService.log('ERROR', f"[UI] Ошибка обновления прогресс-бара: {e}", source="InstallationsTab")
 
     def _is_library_needed(self, library: dict, current_os: str) -> bool:
         """
@@ -890,60 +1204,280 @@ class InstallationsTab(QWidget):
         # Если правила не сработали - библиотека нужна
         return True
 
+    def _compile_args(self, version_json):
+        """
+        Отбирает шаблоны JVM/game-аргументов, разрешённые правилами версии.
+        Правила зависят только от ОС, поэтому результат переиспользуется
+        между запусками (кэш по mtime JSON-файла в self._args_cache).
+        """
+        jvm_templates = []
+        for item in version_json.get("arguments", {}).get("jvm", []):
+            if isinstance(item, str):
+                jvm_templates.append(item)
+            elif isinstance(item, dict):
+                rules = item.get("rules")
+                allowed = True
+                if rules:
+                    allowed = False
+                    for rule in rules:
+                        if rule.get("action") == "allow":
+                            os_rule = rule.get("os", {})
+                            if not os_rule or os_rule.get("name") == "windows":
+                                allowed = True
+                        if rule.get("action") == "disallow":
+                            os_rule = rule.get("os", {})
+                            if os_rule.get("name") == "windows":
+                                allowed = False
+                if allowed:
+                    value = item.get("value")
+                    if isinstance(value, list):
+                        jvm_templates.extend(value)
+                    else:
+                        jvm_templates.append(value)
+        game_templates = []
+        for item in version_json.get("arguments", {}).get("game", []):
+            if isinstance(item, str):
+                game_templates.append(item)
+            elif isinstance(item, dict):
+                rules = item.get("rules")
+                allowed = True
+                if rules:
+                    allowed = False
+                    for rule in rules:
+                        if rule.get("action") == "allow":
+                            allowed = True
+                        if rule.get("action") == "disallow":
+                            allowed = False
+                if allowed:
+                    value = item.get("value")
+                    if isinstance(value, list):
+                        game_templates.extend(value)
+                    else:
+                        game_templates.append(value)
+        return jvm_templates, game_templates
+
     def update_my_builds(self):
-        from pathlib import Path
-        import os
-        from PySide6.QtGui import QPixmap
-        from PySide6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QHBoxLayout
-        # Удаляем старый scroll_area, если есть
-        if hasattr(self, 'scroll_area') and self.scroll_area:
-            layout = self.my_builds_tab.layout() or QVBoxLayout(self.my_builds_tab)
-            layout.removeWidget(self.scroll_area)
-            self.scroll_area.deleteLater()
-            self.scroll_area = None
-        # Создаём scroll area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet(f"background: transparent; border: none;")
-        content_widget = QWidget()
-        vbox = QVBoxLayout(content_widget)
-        vbox.setContentsMargins(12, 12, 12, 12)
-        vbox.setSpacing(16)
-        # Получить список сборок из папки versions
+        """Синхронизация карточек сборок с папкой versions: diff вместо полного перестроения"""
+        # Троттлинг: игнорируем повторные запросы чаще раза в 300 мс
+        now = time.monotonic()
+        if now - self._last_builds_refresh < 0.3:
+            return
+        self._last_builds_refresh = now
         versions_path = self.build_manager.config_manager.get_versions_path()
         builds = []
         for folder in os.listdir(versions_path):
-            build_dir = Path(versions_path) / folder
-            if build_dir.is_dir():
+            if (Path(versions_path) / folder).is_dir():
                 builds.append(folder)
-        if not builds:
-            vbox.addWidget(QLabel("У вас пока нет сборок", alignment=Qt.AlignmentFlag.AlignCenter))
+        current = set(builds)
+        # Убираем карточки исчезнувших сборок
+        for name in list(self.build_widgets):
+            if name not in current:
+                card = self.build_widgets.pop(name)
+                self.builds_vbox.removeWidget(card)
+                card.deleteLater()
+        # Создаём карточки только для новых сборок (перед завершающим stretch);
+        # папка libraries обходится один раз на весь проход, а не на карточку
+        new_builds = [b for b in builds if b not in self.build_widgets]
+        if new_builds:
+            libs_dir = Path(self.build_manager.config_manager.get('minecraft_path')) / "libraries"
+            libs_set = _scan_libs(str(libs_dir)) if libs_dir.exists() else frozenset()
+            for build in new_builds:
+                card = self._create_build_card(build, versions_path, libs_set)
+                self.build_widgets[build] = card
+                self.builds_vbox.insertWidget(self.builds_vbox.count() - 1, card)
+        self.empty_label.setVisible(not self.build_widgets)
+
+    def _create_build_card(self, build, versions_path, libs_set=frozenset()):
+        """Создание карточки одной сборки
+
+        libs_set — результат _scan_libs, общий для всего прохода
+        update_my_builds.
+        """
+        build_dir = Path(versions_path) / build
+        # Картинка
+        img_path = None
+        for ext in ('.png', '.jpg', '.jpeg', '.bmp'):
+            candidate = build_dir / f"{build}{ext}"
+            if candidate.exists():
+                img_path = candidate
+                break
+        # Проверка целостности сборки: результат кэшируется по mtime JSON-файла,
+        # чтобы не перечитывать манифест и не стат-ить библиотеки на каждом построении
+        json_path = build_dir / f"{build}.json"
+        jar_path = build_dir / f"{build}.jar"
+        json_mtime = json_path.stat().st_mtime_ns if json_path.exists() else None
+        cached_status = self._build_status.get(build)
+        if cached_status is not None and cached_status[0] == json_mtime:
+            _, errors, missing_libs = cached_status
         else:
-            for build in builds:
-                build_dir = Path(versions_path) / build
-                # Картинка
-                img_path = None
-                for ext in ('.png', '.jpg', '.jpeg', '.bmp'):
-                    candidate = build_dir / f"{build}{ext}"
-                    if candidate.exists():
-                        img_path = candidate
-                        break
-                # Проверка целостности сборки
-                errors = []
-                json_path = build_dir / f"{build}.json"
-                jar_path = build_dir / f"{build}.jar"
-                if not json_path.exists():
-                    errors.append("Нет JSON-файла версии")
-                if not jar_path.exists():
-                    errors.append("Нет jar-файла версии")
-                missing_libs = []
-                if json_path.exists():
-                    import json
-                    import platform
-                    with open(json_path, encoding="utf-8") as f:
-                        version_json = json.load(f)
-                    libs_dir = Path(self.build_manager.config_manager.get('minecraft_path')) / "libraries"
+            errors = []
+            if not json_path.exists():
+                errors.append("Нет JSON-файла версии")
+            if not jar_path.exists():
+                errors.append("Нет jar-файла версии")
+            missing_libs = []
+            if json_path.exists():
+                import platform
+                version_json = _load_version_json(str(json_path), json_mtime)
+                libs_dir = Path(self.build_manager.config_manager.get('minecraft_path')) / "libraries"
+
+                # Определяем текущую ОС
+                current_os = platform.system().lower()
+                if current_os == "windows":
+                    current_os = "windows"
+                elif current_os == "linux":
+                    current_os = "linux" 
+                elif current_os == "darwin":
+                    current_os = "osx"
+                else:
+                    current_os = "windows"  # fallback
+            
+                for lib in version_json.get('libraries', []):
+                    # Проверяем, нужна ли библиотека для текущей ОС
+                    if not self._is_library_needed(lib, current_os):
+                        continue
                     
+                    artifact = lib.get('downloads', {}).get('artifact')
+                    if artifact:
+                        if artifact['path'] not in libs_set:
+                            lib_path = libs_dir / artifact['path']
+                            # Подробное логирование отсутствующей библиотеки
+                            url = artifact.get('url', 'нет url')
+                            sha1 = artifact.get('sha1', 'нет sha1')
+                            LogService.log('WARNING', f"[MISSING LIB] Build: {build} | Path: {lib_path} | URL: {url} | SHA1: {sha1}", source=build)
+                            missing_libs.append(str(lib_path))
+                if missing_libs:
+                    errors.append(f"Нет библиотек: {len(missing_libs)} шт.")
+        self._build_status[build] = (json_mtime, errors, missing_libs)
+        # Карточка
+        card = QFrame()
+        card.setStyleSheet(_CARD_STYLE)
+        card_layout = QHBoxLayout(card)
+        card_layout.setContentsMargins(10, 8, 10, 8)
+        card_layout.setSpacing(18)
+        # Картинка превью
+        img_label = QLabel()
+        img_label.setFixedSize(64, 64)
+        if img_path:
+            # Превью 64x64 берётся из QPixmapCache по (путь, mtime):
+            # декодирование и масштабирование выполняются один раз на файл
+            cache_key = f"build-preview:{img_path}:{img_path.stat().st_mtime_ns}"
+            pixmap = QPixmap()
+            if not QPixmapCache.find(cache_key, pixmap):
+                pixmap = QPixmap(str(img_path)).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                QPixmapCache.insert(cache_key, pixmap)
+            img_label.setPixmap(pixmap)
+        else:
+            img_label.setText("Нет\nкартинки")
+            img_label.setStyleSheet(_CARD_NO_IMG_STYLE)
+        card_layout.addWidget(img_label)
+        # Если есть ошибки — выводим предупреждение
+        if errors:
+            err_label = QLabel("<br>".join(errors))
+            err_label.setStyleSheet(_CARD_ERR_STYLE)
+            card_layout.addWidget(err_label)
+        # Вертикальный layout для названия и кнопок
+        info_vbox = QVBoxLayout()
+        info_vbox.setSpacing(8)
+        # Название
+        name_label = QLabel(f"<b>{build}</b>")
+        name_label.setStyleSheet(_CARD_NAME_STYLE)
+        info_vbox.addWidget(name_label)
+        # Строка статуса: заполняется push-ом из BuildManager.state_changed
+        # (см. _on_build_state), до первого события скрыта
+        status_label = QLabel()
+        status_label.setFont(FONT_SUB)
+        status_label.setVisible(False)
+        info_vbox.addWidget(status_label)
+        card._status_label = status_label
+        # Горизонтальный layout для кнопок
+        btns_hbox = QHBoxLayout()
+        btns_hbox.setSpacing(12)
+        # Кнопка Играть
+        play_btn = QPushButton("Играть")
+        play_btn.setObjectName("playBtn")
+        play_btn.setStyleSheet(_PLAY_BTN_STYLE)
+        def launch_selected_build():
+            # Вся подготовка запуска (поиск Java, чтение JSON, сбор classpath
+            # и аргументов) уходит в фоновый поток: замыкание не трогает
+            # виджеты, а UI-поток не блокируется диском и сетью
+            threading.Thread(target=_launch_impl, daemon=True).start()
+
+        def _launch_impl():
+            import shutil
+            print("[DEBUG] Играть нажата")
+            LogService.log('DEBUG', "[DEBUG] Играть нажата", source=build)
+            build_dir = Path(versions_path) / build
+            json_path = build_dir / f"{build}.json"
+            jar_path = build_dir / f"{build}.jar"
+            print(f"[DEBUG] build_dir: {build_dir}, json_path: {json_path}, jar_path: {jar_path}")
+            LogService.log('DEBUG', f"[DEBUG] build_dir: {build_dir}, json_path: {json_path}, jar_path: {jar_path}", source=build)
+            # Проверка наличия java
+            java_path_setting = self.build_manager.config_manager.get('java_path', 'auto')
+            java_path = None
+            if java_path_setting and java_path_setting != 'auto':
+                # Сохранённый при прошлом запуске путь — без повторного поиска
+                if os.path.isfile(java_path_setting):
+                    java_path = java_path_setting
+                else:
+                    java_path = shutil.which(java_path_setting)
+            if not java_path:
+                # Пробуем найти java в PATH
+                java_path = shutil.which('java')
+            if not java_path and platform.system() == 'Windows':
+                # JAVA_HOME — самый дешёвый кандидат
+                java_home = os.environ.get('JAVA_HOME')
+                if java_home:
+                    for exe in ('javaw.exe', 'java.exe'):
+                        candidate = os.path.join(java_home, 'bin', exe)
+                        if os.path.isfile(candidate):
+                            java_path = candidate
+                            break
+            if not java_path and platform.system() == 'Windows':
+                # Реестр перед сканом папок: JavaSoft хранит JavaHome установок
+                java_path = _find_java_in_registry()
+            if not java_path and platform.system() == 'Windows':
+                # Пробуем найти javaw.exe/java.exe в Program Files: папки берём
+                # из переменных окружения вместо перебора всех букв дисков
+                pf_dirs = {os.environ.get(var) for var in ('ProgramFiles', 'ProgramFiles(x86)', 'ProgramW6432')}
+                candidates = []
+                for pf in pf_dirs:
+                    if pf and os.path.exists(pf):
+                        candidates += glob.glob(os.path.join(pf, 'Java', '*', 'bin', 'java.exe'))
+                        candidates += glob.glob(os.path.join(pf, 'Java', '*', 'bin', 'javaw.exe'))
+                if candidates:
+                    java_path = candidates[0]
+            print(f"[DEBUG] java_path: {java_path}")
+            LogService.log('DEBUG', f"[DEBUG] java_path: {java_path}", source=build)
+            if java_path:
+                # Сохраняем найденный путь для будущих запусков
+                self.build_manager.config_manager.set('java_path', java_path)
+            if not java_path:
+                LogService.log('ERROR', '[ERROR] Java не найдена! Установите Java 17+ и добавьте в PATH или настройте путь в настройках.', source=build)
+                print('[ERROR] Java не найдена!')
+                return
+            # Проверка jar-файла
+            if not json_path.exists() or not jar_path.exists():
+                LogService.log('ERROR', f'[ERROR] Не найден json или jar-файл: {json_path}, {jar_path}', source=build)
+                print(f'[ERROR] Не найден json или jar-файл: {json_path}, {jar_path}')
+                return
+            try:
+                json_mtime = json_path.stat().st_mtime_ns
+                version_json = _load_version_json(str(json_path), json_mtime)
+                print("[DEBUG] version_json загружен")
+                LogService.log('DEBUG', "[DEBUG] version_json загружен", source=build)
+                # 1. Собираем classpath: результат кэшируется по mtime JSON-файла,
+                # повторный клик «Играть» не статит 200+ библиотек заново
+                cp_cached = self._cp_cache.get(build)
+                if cp_cached is not None and cp_cached[0] == json_mtime:
+                    classpath = cp_cached[1]
+                else:
+                    libraries = []
+                    libs_dir = Path(self.build_manager.config_manager.get('minecraft_path')) / "libraries"
+                    # Пути библиотек собираются конкатенацией строк: PurePath
+                    # на каждую из 200+ библиотек давал лишние аллокации
+                    libs_dir_str = os.fspath(libs_dir)
+                    libs_set = _scan_libs(libs_dir_str) if libs_dir.exists() else frozenset()
                     # Определяем текущую ОС
                     current_os = platform.system().lower()
                     if current_os == "windows":
@@ -954,330 +1488,140 @@ class InstallationsTab(QWidget):
                         current_os = "osx"
                     else:
                         current_os = "windows"  # fallback
-                    
-                    for lib in version_json.get('libraries', []):
+                    print(f"[DEBUG] current_os: {current_os}")
+                    LogService.log('DEBUG', f"[DEBUG] current_os: {current_os}", source=build)
+                    for lib in version_json.get("libraries", []):
                         # Проверяем, нужна ли библиотека для текущей ОС
                         if not self._is_library_needed(lib, current_os):
                             continue
-                            
-                        artifact = lib.get('downloads', {}).get('artifact')
+                        artifact = lib.get("downloads", {}).get("artifact")
                         if artifact:
-                            lib_path = libs_dir / artifact['path']
-                            if not lib_path.exists():
-                                # Подробное логирование отсутствующей библиотеки
-                                url = artifact.get('url', 'нет url')
-                                sha1 = artifact.get('sha1', 'нет sha1')
-                                LogService.log('WARNING', f"[MISSING LIB] Build: {build} | Path: {lib_path} | URL: {url} | SHA1: {sha1}", source=build)
-                                missing_libs.append(str(lib_path))
-                    if missing_libs:
-                        errors.append(f"Нет библиотек: {len(missing_libs)} шт.")
-                # Карточка
-                card = QFrame()
-                card.setStyleSheet(f"""
-                    QFrame {{
-                        background: {MC_GRAY};
-                        border: 2px solid {MC_BORDER};
-                        border-radius: 12px;
-                        margin: 0px;
-                        padding: 10px 18px;
-                    }}
-                """)
-                card_layout = QHBoxLayout(card)
-                card_layout.setContentsMargins(10, 8, 10, 8)
-                card_layout.setSpacing(18)
-                # Картинка превью
-                img_label = QLabel()
-                img_label.setFixedSize(64, 64)
-                if img_path:
-                    pixmap = QPixmap(str(img_path))
-                    img_label.setPixmap(pixmap.scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                            lib_path_str = libs_dir_str + os.sep + artifact["path"].replace('/', os.sep)
+                            if artifact["path"] not in libs_set:
+                                LogService.log('WARNING', f'[WARNING] Библиотека не найдена: {lib_path_str}', source=build)
+                                print(f'[WARNING] Библиотека не найдена: {lib_path_str}')
+                            libraries.append(lib_path_str)
+                    classpath = os.pathsep.join(libraries + [str(jar_path)])
+                    self._cp_cache[build] = (json_mtime, classpath)
+                print(f"[DEBUG] classpath: {classpath}")
+                LogService.log('DEBUG', f"[DEBUG] classpath: {classpath}", source=build)
+                # 2. Получаем mainClass
+                main_class = version_json.get("mainClass")
+                print(f"[DEBUG] mainClass: {main_class}")
+                LogService.log('DEBUG', f"[DEBUG] mainClass: {main_class}", source=build)
+                if not main_class:
+                    LogService.log('ERROR', '[ERROR] mainClass не найден в json', source=build)
+                    print('[ERROR] mainClass не найден в json')
+                    return
+                # 3. Формируем переменные для подстановки (ОФФЛАЙН-РЕЖИМ)
+                nick = self.get_nick_func() if callable(self.get_nick_func) else "Player"
+                offline_uuid = str(uuid.uuid3(uuid.NAMESPACE_DNS, str(nick)))
+                args = {
+                    "auth_player_name": nick,
+                    "version_name": build,
+                    "game_directory": str(build_dir),
+                    "assets_root": str(Path(self.build_manager.config_manager.get('minecraft_path')) / "assets"),
+                    "assets_index_name": version_json.get("assetIndex", {}).get("id", ""),
+                    "auth_uuid": offline_uuid,
+                    "auth_access_token": "0",  # Оффлайн-режим
+                    "clientid": "",
+                    "auth_xuid": "",
+                    "user_type": "legacy",  # Оффлайн-режим
+                    "user_properties": "{}",
+                    "version_type": version_json.get("type", "release"),
+                    "resolution_width": 854,
+                    "resolution_height": 480,
+                    "natives_directory": str(build_dir / "natives"),
+                    "launcher_name": "TKML",
+                    "launcher_version": "1.0",
+                    "classpath": classpath,
+                }
+                for k, v in version_json.items():
+                    if k not in args:
+                        args[k] = v
+                # 4. Собираем JVM arguments: шаблоны, прошедшие фильтр правил,
+                # кэшируются по mtime JSON — правила зависят только от ОС
+                args_cached = self._args_cache.get(build)
+                if args_cached is not None and args_cached[0] == json_mtime:
+                    _, jvm_templates, game_templates = args_cached
                 else:
-                    img_label.setText("Нет\nкартинки")
-                    img_label.setStyleSheet(f"color: {MC_TEXT_MUTED}; font-size: 12px;")
-                card_layout.addWidget(img_label)
-                # Если есть ошибки — выводим предупреждение
-                if errors:
-                    err_label = QLabel("<br>".join(errors))
-                    err_label.setStyleSheet("color: #e74c3c; font-size: 13px; font-weight: bold;")
-                    card_layout.addWidget(err_label)
-                # Вертикальный layout для названия и кнопок
-                info_vbox = QVBoxLayout()
-                info_vbox.setSpacing(8)
-                # Название
-                name_label = QLabel(f"<b>{build}</b>")
-                name_label.setStyleSheet(f"font-size: 18px; color: {MC_TEXT_LIGHT};")
-                info_vbox.addWidget(name_label)
-                # Горизонтальный layout для кнопок
-                btns_hbox = QHBoxLayout()
-                btns_hbox.setSpacing(12)
-                # Кнопка Играть
-                play_btn = QPushButton("Играть")
-                play_btn.setObjectName("playBtn")
-                play_btn.setStyleSheet(
-                    "QPushButton#playBtn {"
-                    "padding: 8px 18px;"
-                    "border-radius: 8px;"
-                    "background: #3a7d44;"
-                    "color: white;"
-                    "font-weight: bold;"
-                    "border: none;"
-                    "}"
-                )
-                def launch_selected_build():
-                    import shutil
-                    import threading
-                    print("[DEBUG] Играть нажата")
-                    LogService.log('DEBUG', "[DEBUG] Играть нажата", source=build)
-                    build_dir = Path(versions_path) / build
-                    json_path = build_dir / f"{build}.json"
-                    jar_path = build_dir / f"{build}.jar"
-                    print(f"[DEBUG] build_dir: {build_dir}, json_path: {json_path}, jar_path: {jar_path}")
-                    LogService.log('DEBUG', f"[DEBUG] build_dir: {build_dir}, json_path: {json_path}, jar_path: {jar_path}", source=build)
-                    # Проверка наличия java
-                    java_path_setting = self.build_manager.config_manager.get('java_path', 'auto')
-                    java_path = None
-                    if java_path_setting and java_path_setting != 'auto':
-                        java_path = shutil.which(java_path_setting)
-                    if not java_path:
-                        # Пробуем найти java в PATH
-                        java_path = shutil.which('java')
-                    if not java_path and platform.system() == 'Windows':
-                        # Пробуем найти javaw.exe/java.exe в Program Files на всех дисках
-                        candidates = []
-                        drives = [f'{chr(d)}:' for d in range(67, 91) if os.path.exists(f'{chr(d)}:')]  # C: ... Z:
-                        for drive in drives:
-                            for pf_base in ['Program Files', 'Program Files (x86)']:
-                                pf = os.path.join(drive + '\\', pf_base)
-                                if os.path.exists(pf):
-                                    candidates += glob.glob(os.path.join(pf, 'Java', '*', 'bin', 'java.exe'))
-                                    candidates += glob.glob(os.path.join(pf, 'Java', '*', 'bin', 'javaw.exe'))
-                        if candidates:
-                            java_path = candidates[0]
-                    print(f"[DEBUG] java_path: {java_path}")
-                    LogService.log('DEBUG', f"[DEBUG] java_path: {java_path}", source=build)
-                    if java_path:
-                        # Сохраняем найденный путь для будущих запусков
-                        self.build_manager.config_manager.set('java_path', java_path)
-                    if not java_path:
-                        LogService.log('ERROR', '[ERROR] Java не найдена! Установите Java 17+ и добавьте в PATH или настройте путь в настройках.', source=build)
-                        print('[ERROR] Java не найдена!')
-                        return
-                    # Проверка jar-файла
-                    if not json_path.exists() or not jar_path.exists():
-                        LogService.log('ERROR', f'[ERROR] Не найден json или jar-файл: {json_path}, {jar_path}', source=build)
-                        print(f'[ERROR] Не найден json или jar-файл: {json_path}, {jar_path}')
-                        return
-                    try:
-                        with open(json_path, encoding="utf-8") as f:
-                            version_json = json.load(f)
-                        print("[DEBUG] version_json загружен")
-                        LogService.log('DEBUG', "[DEBUG] version_json загружен", source=build)
-                        # 1. Собираем classpath
-                        libraries = []
-                        libs_dir = Path(self.build_manager.config_manager.get('minecraft_path')) / "libraries"
-                        # Определяем текущую ОС
-                        current_os = platform.system().lower()
-                        if current_os == "windows":
-                            current_os = "windows"
-                        elif current_os == "linux":
-                            current_os = "linux" 
-                        elif current_os == "darwin":
-                            current_os = "osx"
-                        else:
-                            current_os = "windows"  # fallback
-                        print(f"[DEBUG] current_os: {current_os}")
-                        LogService.log('DEBUG', f"[DEBUG] current_os: {current_os}", source=build)
-                        for lib in version_json.get("libraries", []):
-                            # Проверяем, нужна ли библиотека для текущей ОС
-                            if not self._is_library_needed(lib, current_os):
-                                continue
-                            artifact = lib.get("downloads", {}).get("artifact")
-                            if artifact:
-                                lib_path = libs_dir / artifact["path"]
-                                if not lib_path.exists():
-                                    LogService.log('WARNING', f'[WARNING] Библиотека не найдена: {lib_path}', source=build)
-                                    print(f'[WARNING] Библиотека не найдена: {lib_path}')
-                                libraries.append(str(lib_path))
-                        classpath = os.pathsep.join(libraries + [str(jar_path)])
-                        print(f"[DEBUG] classpath: {classpath}")
-                        LogService.log('DEBUG', f"[DEBUG] classpath: {classpath}", source=build)
-                        # 2. Получаем mainClass
-                        main_class = version_json.get("mainClass")
-                        print(f"[DEBUG] mainClass: {main_class}")
-                        LogService.log('DEBUG', f"[DEBUG] mainClass: {main_class}", source=build)
-                        if not main_class:
-                            LogService.log('ERROR', '[ERROR] mainClass не найден в json', source=build)
-                            print('[ERROR] mainClass не найден в json')
-                            return
-                        # 3. Формируем переменные для подстановки (ОФФЛАЙН-РЕЖИМ)
-                        nick = self.get_nick_func() if callable(self.get_nick_func) else "Player"
-                        offline_uuid = str(uuid.uuid3(uuid.NAMESPACE_DNS, str(nick)))
-                        args = {
-                            "auth_player_name": nick,
-                            "version_name": build,
-                            "game_directory": str(build_dir),
-                            "assets_root": str(Path(self.build_manager.config_manager.get('minecraft_path')) / "assets"),
-                            "assets_index_name": version_json.get("assetIndex", {}).get("id", ""),
-                            "auth_uuid": offline_uuid,
-                            "auth_access_token": "0",  # Оффлайн-режим
-                            "clientid": "",
-                            "auth_xuid": "",
-                            "user_type": "legacy",  # Оффлайн-режим
-                            "user_properties": "{}",
-                            "version_type": version_json.get("type", "release"),
-                            "resolution_width": 854,
-                            "resolution_height": 480,
-                            "natives_directory": str(build_dir / "natives"),
-                            "launcher_name": "TKML",
-                            "launcher_version": "1.0",
-                            "classpath": classpath,
-                        }
-                        for k, v in version_json.items():
-                            if k not in args:
-                                args[k] = v
-                        # 4. Собираем JVM arguments
-                        memory_mb = self.build_manager.config_manager.get('memory_mb', 0)
-                        jvm_args = []
-                        if memory_mb and str(memory_mb).isdigit() and int(memory_mb) > 0:
-                            jvm_args.append(f'-Xmx{int(memory_mb)}M')
-                        for item in version_json.get("arguments", {}).get("jvm", []):
-                            if isinstance(item, str):
-                                jvm_args.append(item)
-                            elif isinstance(item, dict):
-                                rules = item.get("rules")
-                                allowed = True
-                                if rules:
-                                    allowed = False
-                                    for rule in rules:
-                                        if rule.get("action") == "allow":
-                                            os_rule = rule.get("os", {})
-                                            if not os_rule or os_rule.get("name") == "windows":
-                                                allowed = True
-                                        if rule.get("action") == "disallow":
-                                            os_rule = rule.get("os", {})
-                                            if os_rule.get("name") == "windows":
-                                                allowed = False
-                                if allowed:
-                                    value = item.get("value")
-                                    if isinstance(value, list):
-                                        jvm_args.extend(value)
-                                    else:
-                                        jvm_args.append(value)
-                        print(f"[DEBUG] jvm_args: {jvm_args}")
-                        LogService.log('DEBUG', f"[DEBUG] jvm_args: {jvm_args}", source=build)
-                        def safe_format(s):
-                            try:
-                                return s.replace('${', '{').format_map(DefaultDictEmpty(args))
-                            except Exception as e:
-                                LogService.log('ERROR', f'[ERROR] Ошибка подстановки аргумента: {e}', source=build)
-                                print(f'[ERROR] Ошибка подстановки аргумента: {e}')
-                                return s
-                        class DefaultDictEmpty(dict):
-                            def __missing__(self, key):
-                                return ''
-                        jvm_args = [safe_format(v) if isinstance(v, str) else v for v in jvm_args]
-                        # 5. Собираем game arguments
-                        game_args = []
-                        for item in version_json.get("arguments", {}).get("game", []):
-                            if isinstance(item, str):
-                                game_args.append(item)
-                            elif isinstance(item, dict):
-                                rules = item.get("rules")
-                                allowed = True
-                                if rules:
-                                    allowed = False
-                                    for rule in rules:
-                                        if rule.get("action") == "allow":
-                                            allowed = True
-                                        if rule.get("action") == "disallow":
-                                            allowed = False
-                                if allowed:
-                                    value = item.get("value")
-                                    if isinstance(value, list):
-                                        game_args.extend(value)
-                                    else:
-                                        game_args.append(value)
-                        game_args = [arg for arg in game_args if not (isinstance(arg, str) and arg.strip().startswith("--demo"))]
-                        game_args = [safe_format(v) if isinstance(v, str) else v for v in game_args]
-                        
-                        # Фильтруем пустые quick play аргументы
-                        filtered_game_args = []
+                    jvm_templates, game_templates = self._compile_args(version_json)
+                    self._args_cache[build] = (json_mtime, jvm_templates, game_templates)
+                memory_mb = self.build_manager.config_manager.get('memory_mb', 0)
+                jvm_args = []
+                if memory_mb and str(memory_mb).isdigit() and int(memory_mb) > 0:
+                    jvm_args.append(f'-Xmx{int(memory_mb)}M')
+                jvm_args.extend(jvm_templates)
+                print(f"[DEBUG] jvm_args: {jvm_args}")
+                LogService.log('DEBUG', f"[DEBUG] jvm_args: {jvm_args}", source=build)
+                def safe_format(s):
+                    # Один линейный проход регулярки вместо format_map: нет
+                    # конфликтов с литеральными фигурными скобками, незнакомые
+                    # плейсхолдеры заменяются пустой строкой
+                    return _MC_VAR.sub(lambda m: str(args.get(m.group(1), '')), s)
+                jvm_args = [safe_format(v) if isinstance(v, str) else v for v in jvm_args]
+                # 5. Собираем game arguments из закэшированных шаблонов
+                game_args = [arg for arg in game_templates if not (isinstance(arg, str) and arg.strip().startswith("--demo"))]
+                game_args = [safe_format(v) if isinstance(v, str) else v for v in game_args]
+                
+                # Фильтруем пустые quick play аргументы
+                filtered_game_args = []
+                skip_next = False
+                for i, arg in enumerate(game_args):
+                    if skip_next:
                         skip_next = False
-                        for i, arg in enumerate(game_args):
-                            if skip_next:
-                                skip_next = False
+                        continue
+                    
+                    if isinstance(arg, str) and arg.startswith("--quickPlay"):
+                        # Проверяем следующий аргумент
+                        if i + 1 < len(game_args) and isinstance(game_args[i + 1], str):
+                            next_arg = game_args[i + 1]
+                            # Если следующий аргумент пустой или равен пустой строке, пропускаем оба
+                            if not next_arg or next_arg.strip() == "":
+                                skip_next = True
                                 continue
-                            
-                            if isinstance(arg, str) and arg.startswith("--quickPlay"):
-                                # Проверяем следующий аргумент
-                                if i + 1 < len(game_args) and isinstance(game_args[i + 1], str):
-                                    next_arg = game_args[i + 1]
-                                    # Если следующий аргумент пустой или равен пустой строке, пропускаем оба
-                                    if not next_arg or next_arg.strip() == "":
-                                        skip_next = True
-                                        continue
-                            
-                            filtered_game_args.append(arg)
-                        
-                        game_args = filtered_game_args
-                        print(f"[DEBUG] game_args: {game_args}")
-                        LogService.log('DEBUG', f"[DEBUG] game_args: {game_args}", source=build)
-                        # 6. Запуск Minecraft через MinecraftRunner в отдельном потоке
-                        def run_mc():
-                            print("[DEBUG] Запуск MinecraftRunner.run")
-                            LogService.log('DEBUG', "[DEBUG] Запуск MinecraftRunner.run", source=build)
-                            MinecraftRunner.run(
-                                java_path=java_path,
-                                main_class=main_class,
-                                classpath=classpath,
-                                natives_dir=str(build_dir / "natives"),
-                                game_dir=str(build_dir),
-                                assets_dir=str(Path(self.build_manager.config_manager.get('minecraft_path')) / "assets"),
-                                assets_index=version_json.get("assetIndex", {}).get("id", ""),
-                                username=str(nick),
-                                uuid_=offline_uuid,
-                                width=854,
-                                height=480,
-                                extra_jvm_args=jvm_args,
-                                extra_game_args=game_args,
-                                log_callback=lambda msg: LogService.log('INFO', msg, source=build)
-                            )
-                        threading.Thread(target=run_mc, daemon=True).start()
-                    except Exception as e:
-                        LogService.log('ERROR', f'[ERROR] Ошибка запуска: {e}', source=build)
-                        print(f'[ERROR] Ошибка запуска: {e}')
-                play_btn.clicked.connect(launch_selected_build)
-                btns_hbox.addWidget(play_btn)
-                # Кнопка Настройки
-                settings_btn = QPushButton("Настройки")
-                settings_btn.setObjectName("settingsBtn")
-                settings_btn.setStyleSheet(
-                    "QPushButton#settingsBtn {"
-                    "padding: 8px 18px;"
-                    "border-radius: 8px;"
-                    "background: #3a7dcf;"
-                    "color: white;"
-                    "font-weight: bold;"
-                    "border: none;"
-                    "}"
+                    
+                    filtered_game_args.append(arg)
+                
+                game_args = filtered_game_args
+                print(f"[DEBUG] game_args: {game_args}")
+                LogService.log('DEBUG', f"[DEBUG] game_args: {game_args}", source=build)
+                # 6. Запуск Minecraft через MinecraftRunner в отдельном потоке
+                # Мы уже в фоновом потоке — отдельный поток под run не нужен
+                print("[DEBUG] Запуск MinecraftRunner.run")
+                LogService.log('DEBUG', "[DEBUG] Запуск MinecraftRunner.run", source=build)
+                MinecraftRunner.run(
+                    java_path=java_path,
+                    main_class=main_class,
+                    classpath=classpath,
+                    natives_dir=str(build_dir / "natives"),
+                    game_dir=str(build_dir),
+                    assets_dir=str(Path(self.build_manager.config_manager.get('minecraft_path')) / "assets"),
+                    assets_index=version_json.get("assetIndex", {}).get("id", ""),
+                    username=str(nick),
+                    uuid_=offline_uuid,
+                    width=854,
+                    height=480,
+                    extra_jvm_args=jvm_args,
+                    extra_game_args=game_args,
+                    log_callback=lambda msg: LogService.log('INFO', msg, source=build)
                 )
-                settings_btn.clicked.connect(lambda _, b=build: print(f'Настройки: {b}'))
-                btns_hbox.addWidget(settings_btn)
-                btns_hbox.addStretch()
-                info_vbox.addLayout(btns_hbox)
-                info_vbox.addStretch()
-                card_layout.addLayout(info_vbox)
-                vbox.addWidget(card)
-        vbox.addStretch()
-        self.scroll_area.setWidget(content_widget)
-        # Очищаем и добавляем scroll_area в my_builds_tab
-        layout = self.my_builds_tab.layout() or QVBoxLayout(self.my_builds_tab)
-        for i in reversed(range(layout.count())):
-            item = layout.itemAt(i)
-            widget = item.widget() if item else None
-            if widget is not None:
-                widget.setParent(None)
-        layout.addWidget(self.scroll_area)
+            except Exception as e:
+                LogService.log('ERROR', f'[ERROR] Ошибка запуска: {e}', source=build)
+                print(f'[ERROR] Ошибка запуска: {e}')
+        play_btn.clicked.connect(launch_selected_build)
+        btns_hbox.addWidget(play_btn)
+        # Кнопка Настройки
+        settings_btn = QPushButton("Настройки")
+        settings_btn.setObjectName("settingsBtn")
+        settings_btn.setStyleSheet(_SETTINGS_BTN_STYLE)
+        settings_btn.clicked.connect(lambda _, b=build: print(f'Настройки: {b}'))
+        btns_hbox.addWidget(settings_btn)
+        btns_hbox.addStretch()
+        info_vbox.addLayout(btns_hbox)
+        info_vbox.addStretch()
+        card_layout.addLayout(info_vbox)
+        return card
 
     def create_build(self):
         from PySide6.QtCore import QThread
@@ -1312,6 +1656,11 @@ class InstallationsTab(QWidget):
         self.build_worker.error.connect(self.build_thread.quit)
         self.build_thread.finished.connect(self.build_worker.deleteLater)
         self.build_thread.finished.connect(self.build_thread.deleteLater)
+        # Учёт живых потоков для корректного завершения в closeEvent
+        self.threads.append(self.build_thread)
+        self.build_thread.finished.connect(
+            lambda th=self.build_thread: th in self.threads and self.threads.remove(th)
+        )
         self.build_thread.start()
         self.progress.setVisible(True)
         self.progress.setValue(0)
@@ -1321,6 +1670,48 @@ class InstallationsTab(QWidget):
             sender.setEnabled(False)
             sender.setText("Создание сборки...")
 
+    @Slot(str, object, int, str)
+    def _on_build_state(self, build_name, status, progress, message):
+        """Обновление строки статуса на карточке сборки по сигналу смены состояния"""
+        card = self.build_widgets.get(build_name)
+        label = getattr(card, '_status_label', None)
+        if label is None:
+            return
+        value = status.value if isinstance(status, BuildStatus) else status
+        text = message or _STATUS_TEXT.get(value, "Неизвестно")
+        if value in ("downloading", "installing") and progress:
+            text = f"{text} ({progress}%)"
+        label.setText(text)
+        label.setStyleSheet(f"color: {_STATUS_COLOR.get(value, '#aaa')};")
+        label.setVisible(True)
+
+    def shutdown_workers(self):
+        """Останов фоновых потоков и таймеров перед закрытием
+
+        Вкладка живёт внутри QStackedWidget и собственного close-события
+        не получает, поэтому метод вызывается явно из MainWindow.closeEvent.
+        """
+        self._log_flush_timer.stop()
+        # Дебаунс-таймер существует только после построения вкладки создания
+        if getattr(self, '_fetch_debounce', None) is not None:
+            self._fetch_debounce.stop()
+        if getattr(self, 'build_worker', None) is not None:
+            self.build_worker.is_running = False
+        for thread in list(self.threads):
+            if thread.isRunning():
+                thread.requestInterruption()
+                thread.quit()
+                if not thread.wait(2000):
+                    LogService.log('WARNING', 'Поток сборки не завершился за 2 секунды', source='InstallationsTab')
+        self.threads.clear()
+        self._fetch_pool.waitForDone(2000)
+
+    def closeEvent(self, event):
+        self.shutdown_workers()
+        # Тесты вызывают closeEvent(None) напрямую — событие может отсутствовать
+        if event is not None:
+            super().closeEvent(event)
+
     def _on_build_finished(self):
         LogService.log('INFO', "Сборка создана успешно!", source=self.current_build_name or 'InstallationsTab')
         self.progress.setValue(100)
@@ -1342,6 +1733,22 @@ class InstallationsTab(QWidget):
             sender.setText("Создать сборку")
 
     def set_active_tab(self, idx):
+        # Ленивое построение тяжёлых вкладок при первом открытии
+        if idx == 1 and not self._create_tab_built:
+            self._build_create_tab()
+        elif idx == 2 and not self._ready_tab_built:
+            ready_layout = QVBoxLayout(self.ready_tab)
+            ready_layout.addWidget(QLabel("Готовые сборки (скоро)", alignment=Qt.AlignmentFlag.AlignCenter))
+            self._ready_tab_built = True
         for i, btn in enumerate(self.sidebar_btns):
             btn.setChecked(i == idx)
         self.tabs_content.setCurrentIndex(idx)
+
+    def _build_create_tab(self):
+        """Построение вкладки создания сборки при первом открытии"""
+        self.setup_create_tab()
+        self._wire_create_tab()
+        self._create_tab_built = True
+        # Если манифест уже успел загрузиться в фоне — заполняем комбобокс сразу
+        if self._release_ids is not None:
+            self._populate_version_combo()
@@ -22,8 +22,29 @@ def is_valid_nick(nick: str) -> bool:
     return bool(re.fullmatch(r"[A-Za-z0-9_]{3,16}", nick))
 
 
+# Кэш аватарок: одна загрузка/отрисовка на (ник, размер) за сессию
+_AVATAR_CACHE = {}
+
+# Серые заглушки: один QPixmap на размер, общий для всех ников без аватара
+_PLACEHOLDER_CACHE = {}
+
+
+def _placeholder_pixmap(size: int) -> QPixmap:
+    """Возвращает общую серую заглушку нужного размера"""
+    pixmap = _PLACEHOLDER_CACHE.get(size)
+    if pixmap is None:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(QColor("lightgray"))
+        _PLACEHOLDER_CACHE[size] = pixmap
+    return pixmap
+
+
 def get_avatar_pixmap(nick: str, size: int = AVATAR_SIZE) -> QPixmap:
     """Загружает аватарку с minotar.net, если не удалось — возвращает заглушку"""
+    cache_key = (nick, size)
+    cached = _AVATAR_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     url = f"https://minotar.net/avatar/{nick}/{size}"
     try:
         # Используем DownloadService для загрузки аватара
@@ -32,12 +53,13 @@ def get_avatar_pixmap(nick: str, size: int = AVATAR_SIZE) -> QPixmap:
         if response_data:
             pixmap = QPixmap()
             pixmap.loadFromData(response_data.encode('utf-8') if isinstance(response_data, str) else response_data)
+            _AVATAR_CACHE[cache_key] = pixmap
             return pixmap
     except Exception as e:
         LogService.log('WARNING', f"Не удалось загрузить аватар для {nick}: {e}", source="ProfilesTab")
-    # Заглушка: просто пустой серый квадрат
-    pixmap = QPixmap(size, size)
-    pixmap.fill(QColor("lightgray"))
+    # Заглушка: общий серый квадрат (тоже кэшируем, чтобы не долбить сеть при промахах)
+    pixmap = _placeholder_pixmap(size)
+    _AVATAR_CACHE[cache_key] = pixmap
     return pixmap
 
 
@@ -358,5 +358,5 @@ class SettingsTab(QWidget):
         mw = self.window()
         profile_widget = getattr(mw, "profile_widget", None)
         if profile_widget is not None:
-            profile_widget.nick.setText(new_nick or "Гость") 
+            profile_widget.set_nick(new_nick)
 